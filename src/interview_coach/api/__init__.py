@@ -11,13 +11,11 @@ Provides REST API endpoints for:
 """
 
 from .main import app
-from .interview_service import InterviewService, interview_service
-from .evaluation_service import EvaluationService, evaluation_service
+from .interview_service import InterviewService
+from .evaluation_service import EvaluationService
 
 __all__ = [
     "app",
     "InterviewService",
-    "interview_service", 
     "EvaluationService",
-    "evaluation_service",
 ]
@@ -6,27 +6,66 @@ This service provides a standalone evaluation capability that can be used
 to assess candidate performance based on job descriptions and interview transcripts.
 """
 
+import asyncio
+import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol, Sequence, Tuple
 
+from crewai import Crew
+
+from interview_coach.cache import TTLCache
+from interview_coach.config import env_int
 from interview_coach.crews.evaluation_crew.evaluation_crew import EvaluationCrew
 
+from .formatting import format_transcript, split_report_sections
+
 logger = logging.getLogger(__name__)
 
+# Finished evaluation reports are kept this long for identical re-submissions
+REPORT_CACHE_TTL = 3600
+
+# Cap on evaluation crews running at once; further requests queue rather
+# than all hitting the LLM provider (and its rate limits) together
+MAX_CONCURRENT_EVALUATIONS = env_int("EVALUATION_MAX_CONCURRENCY", 4)
+
+
+@lru_cache(maxsize=1)
+def _evaluation_crew() -> Crew:
+    """
+    Build the EvaluationCrew once per process.
+    
+    Crew construction parses the YAML configs and builds the agents, so it
+    is done a single time; each evaluation runs on a copy because a Crew
+    keeps per-run task state.
+    """
+    return EvaluationCrew().crew()
+
 
 # ============================================================================
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QuestionAnswerPair:
     """Represents a single question-answer pair from an interview."""
     question: str
     answer: str
 
 
+class QuestionAnswer(Protocol):
+    """
+    Anything with ``question`` and ``answer`` attributes.
+
+    Lets the service consume already-validated API request models
+    directly instead of copying them into ``QuestionAnswerPair``.
+    """
+    question: str
+    answer: str
+
+
 @dataclass
 class EvaluationInput:
     """Input data required for evaluation."""
@@ -35,7 +74,7 @@ class EvaluationInput:
     candidate_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of an interview evaluation."""
     evaluation_report: str
@@ -69,9 +108,19 @@ class EvaluationService:
     
     def __init__(self):
         """Initialize the evaluation service."""
+        # Evaluations currently running, keyed by their crew inputs, so
+        # identical concurrent requests share a single crew run
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Finished reports, keyed the same way, for repeat submissions
+        self._reports = TTLCache(maxsize=256, ttl=REPORT_CACHE_TTL)
+        self._crew_slots = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
         logger.info("EvaluationService initialized")
     
-    def _format_transcript(self, transcript: List[QuestionAnswerPair]) -> str:
+    def warm_up(self) -> None:
+        """Build the evaluation crew so the first request doesn't pay for it."""
+        _evaluation_crew()
+    
+    def _format_transcript(self, transcript: Sequence[QuestionAnswer]) -> str:
         """
         Format the question-answer pairs into a readable transcript string.
         
@@ -81,18 +130,12 @@ class EvaluationService:
         Returns:
             Formatted transcript string for the evaluation crew
         """
-        lines = []
-        for i, qa in enumerate(transcript, 1):
-            lines.append(f"\n[QUESTION {i}]")
-            lines.append(f"Interviewer: {qa.question}")
-            lines.append(f"Candidate: {qa.answer}")
-        
-        return "\n".join(lines)
+        return format_transcript((qa.question, qa.answer) for qa in transcript)
     
     async def evaluate(
         self,
         job_description: str,
-        transcript: List[QuestionAnswerPair],
+        transcript: Sequence[QuestionAnswer],
         candidate_name: Optional[str] = None
     ) -> EvaluationResult:
         """
@@ -100,7 +143,9 @@ class EvaluationService:
         
         Args:
             job_description: The job description for the role
-            transcript: List of question-answer pairs from the interview
+            transcript: Question-answer pairs from the interview
+                (``QuestionAnswerPair`` or any object with ``question`` and
+                ``answer`` attributes, such as the API request models)
             candidate_name: Optional name of the candidate
             
         Returns:
@@ -109,39 +154,23 @@ class EvaluationService:
         Raises:
             ValueError: If transcript is empty or job_description is too short
         """
-        # Validate inputs
-        if not transcript:
-            raise ValueError("Interview transcript cannot be empty")
-        
-        if len(job_description.strip()) < 50:
-            raise ValueError("Job description must be at least 50 characters")
+        self._validate_request(job_description, transcript)
         
         # Format transcript for evaluation
         transcript_text = self._format_transcript(transcript)
         
         logger.info(
-            f"🔍 Running evaluation for {candidate_name or 'candidate'} "
-            f"with {len(transcript)} Q&A pairs..."
+            "🔍 Running evaluation for %s with %d Q&A pairs...",
+            candidate_name or "candidate", len(transcript)
         )
         
         # Run the evaluation crew
         try:
-            result = await (
-                EvaluationCrew()
-                .crew()
-                .kickoff_async(inputs={
-                    "interview_transcript": transcript_text,
-                    "job_description": job_description
-                })
+            evaluation_report = await self._run_coalesced(
+                job_description, transcript_text
             )
             
-            # Extract evaluation report
-            try:
-                evaluation_report = result.raw  # type: ignore
-            except (AttributeError, TypeError):
-                evaluation_report = str(result)
-            
-            logger.info(f"✅ Evaluation completed successfully")
+            logger.info("✅ Evaluation completed successfully")
             
             return EvaluationResult(
                 evaluation_report=evaluation_report,
@@ -152,9 +181,147 @@ class EvaluationService:
             )
             
         except Exception as e:
-            logger.exception(f"❌ Evaluation failed: {e}")
+            logger.exception("❌ Evaluation failed: %s", e)
             raise RuntimeError(f"Evaluation failed: {str(e)}") from e
     
+    async def evaluate_stream(
+        self,
+        job_description: str,
+        transcript: Sequence[QuestionAnswer],
+        candidate_name: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Evaluate an interview transcript, yielding the report section by section.
+        
+        A "started" event is yielded as soon as the request is accepted, so
+        callers can acknowledge it before the crew finishes; the report is
+        then yielded one "## " section at a time, followed by "done".
+        
+        Args:
+            job_description: The job description for the role
+            transcript: Question-answer pairs from the interview
+            candidate_name: Optional name of the candidate
+            
+        Yields:
+            (event, data) tuples: ("started", ...), ("section", {"title",
+            "content"}) per report section, then ("done", ...)
+            
+        Raises:
+            ValueError: If transcript is empty or job_description is too short
+            RuntimeError: If the evaluation crew fails
+        """
+        self._validate_request(job_description, transcript)
+        
+        transcript_text = self._format_transcript(transcript)
+        questions_evaluated = len(transcript)
+        
+        yield "started", {
+            "candidate_name": candidate_name,
+            "questions_evaluated": questions_evaluated
+        }
+        
+        logger.info(
+            "🔍 Streaming evaluation for %s with %d Q&A pairs...",
+            candidate_name or "candidate", questions_evaluated
+        )
+        
+        try:
+            evaluation_report = await self._run_coalesced(
+                job_description, transcript_text
+            )
+        except Exception as e:
+            logger.exception("❌ Evaluation failed: %s", e)
+            raise RuntimeError(f"Evaluation failed: {str(e)}") from e
+        
+        for title, content in split_report_sections(evaluation_report):
+            yield "section", {"title": title, "content": content}
+        
+        yield "done", {
+            "candidate_name": candidate_name,
+            "questions_evaluated": questions_evaluated,
+            "evaluated_at": datetime.now().isoformat()
+        }
+    
+    def _validate_request(self, job_description: str, transcript: Sequence[QuestionAnswer]) -> None:
+        """
+        Reject invalid evaluation requests before any work is done.
+        
+        Raises:
+            ValueError: If transcript is empty or job_description is too short
+        """
+        if not transcript:
+            raise ValueError("Interview transcript cannot be empty")
+        
+        if len(job_description.strip()) < 50:
+            raise ValueError("Job description must be at least 50 characters")
+    
+    async def _run_coalesced(self, job_description: str, transcript_text: str) -> str:
+        """
+        Run the evaluation crew, reusing a cached report or joining an
+        identical run already in flight.
+        
+        Args:
+            job_description: The job description for the role
+            transcript_text: Formatted interview transcript
+            
+        Returns:
+            The raw evaluation report
+        """
+        key = hashlib.sha256(
+            f"{job_description}\x00{transcript_text}".encode()
+        ).hexdigest()
+        
+        report = self._reports.get(key)
+        if report is not None:
+            logger.info("♻️ Reusing cached evaluation for identical transcript")
+            return report
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._run_crew(job_description, transcript_text)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_run(key, t))
+        else:
+            logger.info("Joining in-flight evaluation for identical transcript")
+        
+        # Shield so one caller disconnecting doesn't cancel the shared run
+        return await asyncio.shield(task)
+    
+    def _finish_run(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished run from the in-flight map and cache its report."""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None and task.result():
+            self._reports.set(key, task.result())
+    
+    async def _run_crew(self, job_description: str, transcript_text: str) -> str:
+        """
+        Kick off the evaluation crew and extract its report.
+        
+        Args:
+            job_description: The job description for the role
+            transcript_text: Formatted interview transcript
+            
+        Returns:
+            The raw evaluation report
+        """
+        # Copying the crew deep-copies its agents and tasks, so do it on the
+        # worker thread together with the (blocking) kickoff
+        async with self._crew_slots:
+            result = await asyncio.to_thread(
+                lambda: _evaluation_crew().copy().kickoff(inputs={
+                    "interview_transcript": transcript_text,
+                    "job_description": job_description
+                })
+            )
+        
+        # Extract evaluation report
+        try:
+            return result.raw  # type: ignore
+        except (AttributeError, TypeError):
+            return str(result)
+    
     async def evaluate_from_input(self, evaluation_input: EvaluationInput) -> EvaluationResult:
         """
         Evaluate using an EvaluationInput object.
@@ -172,7 +339,3 @@ class EvaluationService:
             transcript=evaluation_input.transcript,
             candidate_name=evaluation_input.candidate_name
         )
-
-
-# Global service instance (singleton)
-evaluation_service = EvaluationService()
@@ -0,0 +1,57 @@
+# Formatting Helpers
+"""
+Shared text formatting for the Interview Coach API.
+
+Keeps the transcript layout fed to the EvaluationCrew in one place so every
+caller produces byte-identical prompts for the same interview.
+"""
+
+import re
+from typing import Iterable, List, Tuple
+
+# One transcript entry as fed to the evaluation crew
+TRANSCRIPT_ENTRY_TEMPLATE = "\n[QUESTION {n}]\nInterviewer: {q}\nCandidate: {a}"
+
+# Top-level sections of the evaluation report ("## Executive Summary", ...)
+_REPORT_SECTION_RE = re.compile(r"^##[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+
+def format_transcript(pairs: Iterable[Tuple[str, str]]) -> str:
+    """
+    Format question-answer pairs into the evaluation transcript.
+
+    Args:
+        pairs: (question, answer) tuples in interview order
+
+    Returns:
+        Formatted transcript string for the evaluation crew
+    """
+    return "\n".join(
+        TRANSCRIPT_ENTRY_TEMPLATE.format(n=i, q=question, a=answer)
+        for i, (question, answer) in enumerate(pairs, 1)
+    )
+
+
+def split_report_sections(report: str) -> List[Tuple[str, str]]:
+    """
+    Split an evaluation report into its ``##`` sections.
+
+    Args:
+        report: Markdown report produced by the evaluation crew
+
+    Returns:
+        (title, content) tuples in report order; any text before the first
+        heading is returned with an empty title
+    """
+    sections = []
+    matches = list(_REPORT_SECTION_RE.finditer(report))
+
+    preamble = report[:matches[0].start()] if matches else report
+    if preamble.strip():
+        sections.append(("", preamble.strip()))
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(report)
+        sections.append((match.group(1), report[match.end():end].strip()))
+
+    return sections
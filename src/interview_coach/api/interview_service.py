@@ -1,18 +1,38 @@
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
-from interview_coach.questions_flow import GenerateInterviewQuestionsFlow
-from rag.rag_service import ResumeRAGService
+from interview_coach.cache import SemanticCache, content_key, normalize_text
+from interview_coach.config import env_int
+from interview_coach.questions_flow import (
+    GenerateInterviewQuestionsFlow,
+    new_session_id,
+    warm_up_crews,
+)
+from rag.rag_service import get_rag_service
 
 logger = logging.getLogger(__name__)
 
+# Generated questions per (job description, resume) pair; paraphrased job
+# descriptions for the same resume and role are matched by embedding similarity
+QUESTION_CACHE_TTL = 24 * 3600
+QUESTION_CACHE_SIZE = 1000
+QUESTION_CACHE_SIMILARITY = 0.93
+
+MIN_JOB_DESCRIPTION_LENGTH = 50
+
+# Cap on question flows running at once; each flow already bounds its own
+# crew calls (INTERVIEW_MAX_CONCURRENCY), this bounds them across requests
+MAX_CONCURRENT_FLOWS = env_int("INTERVIEW_MAX_FLOWS", 4)
+
 
 # ============================================================================
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QuestionGenerationResult:
     """Result of question generation."""
     session_id: str
@@ -22,6 +42,25 @@ class QuestionGenerationResult:
     topics: List[str]
 
 
+@dataclass(slots=True)
+class _CacheLookup:
+    """Where a request's question set is (or will be) cached."""
+    key: str
+    resume_sha: str
+    normalized_jd: str
+    # Semantic matching scope; None means exact matches only
+    namespace: Optional[str] = None
+    embedding: Optional[List[float]] = None
+
+
+def _role_line(job_description: str) -> str:
+    """Return the posting's title line (role and level), normalized."""
+    for line in job_description.splitlines():
+        if line.strip():
+            return normalize_text(line)[:120]
+    return ""
+
+
 # ============================================================================
 # Interview Service (Stateless Question Generation)
 # ============================================================================
@@ -36,67 +75,352 @@ class InterviewService:
     """
     
     def __init__(self):
-        self.rag_service = ResumeRAGService()
+        self.rag_service = get_rag_service()
+        self._question_cache = SemanticCache(
+            threshold=QUESTION_CACHE_SIMILARITY,
+            maxsize=QUESTION_CACHE_SIZE,
+            ttl=QUESTION_CACHE_TTL
+        )
+        self._flow_slots = asyncio.Semaphore(MAX_CONCURRENT_FLOWS)
+        # Background cache embeddings and abandoned stream runs, referenced
+        # until they finish
+        self._background_tasks: Set[asyncio.Task] = set()
     
     async def generate_questions(
         self,
         candidate_name: str,
         job_description: str,
-        resume_pdf_path: Optional[str] = None
+        resume_pdf_path: Optional[str] = None,
+        resume_sha: Optional[str] = None
     ) -> QuestionGenerationResult:
         """
         Generate interview questions based on job description and optional resume.
         
         This is a stateless operation - the flow is created, executed, and
-        discarded after returning the results.
+        discarded after returning the results. Results are cached per resume
+        and job description (exact, or semantically similar for the same
+        resume and role), so repeat submissions return immediately with a
+        fresh session_id.
         
         Args:
             candidate_name: Name of the candidate
             job_description: The job description to generate questions for
             resume_pdf_path: Optional path to resume PDF file
+            resume_sha: SHA256 of the resume PDF, if already known (skips
+                re-reading the file to hash it)
             
         Returns:
             QuestionGenerationResult with session_id (for reference only),
             candidate name, and list of generated questions
             
         Raises:
-            ValueError: If job description is too short or invalid
+            ValueError: If job description is too short or the resume is missing
             RuntimeError: If question generation fails
         """
+        self._validate_request(job_description, resume_pdf_path)
+        
+        cached, lookup = await self._lookup_cached(job_description, resume_pdf_path, resume_sha)
+        if cached is not None:
+            logger.info("♻️ Reusing cached questions for %s", candidate_name)
+            return self._from_cache(cached, candidate_name, job_description)
+        
+        # Create and run the flow
+        flow = GenerateInterviewQuestionsFlow(rag_service=self.rag_service)
+        payload = self._flow_payload(candidate_name, job_description, resume_pdf_path, lookup)
+        
+        logger.info("🎯 Generating questions for %s...", candidate_name)
+        
+        # Run the flow asynchronously
         try:
-            # Create and run the flow
-            flow = GenerateInterviewQuestionsFlow()
-            
-            payload = {
-                "candidate_name": candidate_name,
-                "job_description": job_description,
-                "resume_pdf_path": resume_pdf_path or ""
-            }
-            
-            logger.info(f"🎯 Generating questions for {candidate_name}...")
-            
-            # Run the flow asynchronously
-            await flow.kickoff_async(payload)
-            
-            # Extract results from flow state
-            session_id = flow.state.session_id
-            questions = flow.state.questions
-            topics = flow.state.interview_topics
+            await self._run_flow(flow, payload)
+        except Exception as e:
+            logger.exception("❌ Failed to generate questions: %s", e)
+            raise RuntimeError(f"Question generation failed: {str(e)}") from e
+        
+        result = self._flow_result(flow, candidate_name, job_description)
+        self._cache_result(lookup, result)
+        return result
+    
+    async def stream_questions(
+        self,
+        candidate_name: str,
+        job_description: str,
+        resume_pdf_path: Optional[str] = None,
+        resume_sha: Optional[str] = None
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Generate interview questions, yielding each one as soon as it is ready.
+        
+        Questions arrive in completion order, so the first one is available
+        after the fastest generation rather than the slowest. Uses the same
+        question cache as generate_questions: a cached set is yielded at
+        once, and a completed run is stored for later requests.
+        
+        Args:
+            candidate_name: Name of the candidate
+            job_description: The job description to generate questions for
+            resume_pdf_path: Optional path to resume PDF file
+            resume_sha: SHA256 of the resume PDF, if already known
             
-            logger.info(f"✅ Generated {len(questions)} questions for session {session_id}")
+        Yields:
+            (index, question) tuples, where index is the question's position
+            in the final topic order
             
-            return QuestionGenerationResult(
-                session_id=session_id,
-                candidate_name=candidate_name,
-                job_description=job_description,
-                questions=questions,
-                topics=topics
-            )
+        Raises:
+            ValueError: If job description is too short or the resume is missing
+            RuntimeError: If question generation fails
+        """
+        self._validate_request(job_description, resume_pdf_path)
+        
+        cached, lookup = await self._lookup_cached(job_description, resume_pdf_path, resume_sha)
+        if cached is not None:
+            logger.info("♻️ Reusing cached questions for %s", candidate_name)
+            for item in enumerate(list(cached.questions)):
+                yield item
+            return
+        
+        flow = GenerateInterviewQuestionsFlow(rag_service=self.rag_service)
+        payload = self._flow_payload(candidate_name, job_description, resume_pdf_path, lookup)
+        
+        logger.info("🎯 Streaming questions for %s...", candidate_name)
+        
+        run = asyncio.create_task(self._run_flow(flow, payload))
+        next_question: Optional[asyncio.Task] = None
+        try:
+            while True:
+                next_question = asyncio.create_task(flow.question_stream.get())
+                await asyncio.wait(
+                    {next_question, run}, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if next_question.done():
+                    yield next_question.result()
+                    continue
+                
+                # Flow finished: flush anything published in the meantime
+                next_question.cancel()
+                while not flow.question_stream.empty():
+                    yield flow.question_stream.get_nowait()
+                break
             
+            await run
         except Exception as e:
-            logger.exception(f"❌ Failed to generate questions: {e}")
+            logger.exception("❌ Failed to stream questions: %s", e)
             raise RuntimeError(f"Question generation failed: {str(e)}") from e
-
-
-# Global service instance (singleton)
-interview_service = InterviewService()
+        finally:
+            if next_question is not None and not next_question.done():
+                next_question.cancel()
+            if not run.done():
+                # The client went away mid-stream. Cancelling would free the
+                # flow slot and RAG session while the flow's ingestion and
+                # crews keep running on worker threads, so let it finish
+                self._finish_in_background(run, flow, lookup, candidate_name, job_description)
+        
+        self._cache_result(lookup, self._flow_result(flow, candidate_name, job_description))
+    
+    def _finish_in_background(
+        self,
+        run: asyncio.Task,
+        flow: GenerateInterviewQuestionsFlow,
+        lookup: _CacheLookup,
+        candidate_name: str,
+        job_description: str
+    ) -> None:
+        """Keep an abandoned flow run alive and cache its questions when it ends."""
+        def finished(task: asyncio.Task) -> None:
+            self._background_tasks.discard(task)
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                logger.warning("⚠️ Abandoned question stream failed: %s", task.exception())
+                return
+            self._cache_result(lookup, self._flow_result(flow, candidate_name, job_description))
+        
+        self._background_tasks.add(run)
+        run.add_done_callback(finished)
+    
+    def _validate_request(self, job_description: str, resume_pdf_path: Optional[str]) -> None:
+        """
+        Reject invalid requests before any work is done.
+        
+        Raises:
+            ValueError: If job description is too short or the resume is missing
+        """
+        if len(job_description.strip()) < MIN_JOB_DESCRIPTION_LENGTH:
+            raise ValueError(
+                f"Job description must be at least {MIN_JOB_DESCRIPTION_LENGTH} characters"
+            )
+        
+        if resume_pdf_path and not Path(resume_pdf_path).is_file():
+            raise ValueError(f"Resume file not found: {resume_pdf_path}")
+    
+    def warm_up(self) -> None:
+        """
+        Build the question flow's crews and open the embeddings connection
+        so the first request doesn't pay for either.
+        """
+        warm_up_crews()
+        try:
+            self.rag_service.warm_up()
+        except Exception as e:
+            logger.warning("⚠️ Embeddings warm-up failed, connecting lazily instead: %s", e)
+    
+    async def _lookup_cached(
+        self,
+        job_description: str,
+        resume_pdf_path: Optional[str],
+        resume_sha: Optional[str]
+    ) -> Tuple[Optional[QuestionGenerationResult], _CacheLookup]:
+        """
+        Find a cached question set for a request.
+        
+        Exact matches are keyed by the normalized job description and the
+        resume hash. Semantic matches are only tried for requests with a
+        resume, within the same resume and role line, and only when that
+        scope holds an entry to compare against, so misses usually cost no
+        embedding call.
+        
+        Returns:
+            (cached result or None, where the result should be cached)
+        """
+        if not resume_pdf_path:
+            resume_sha = ""
+        elif not resume_sha:
+            resume_sha = await asyncio.to_thread(
+                self.rag_service.calculate_file_hash, resume_pdf_path
+            )
+        
+        normalized_jd = normalize_text(job_description)
+        lookup = _CacheLookup(
+            key=content_key(normalized_jd, resume_sha),
+            resume_sha=resume_sha,
+            normalized_jd=normalized_jd,
+            namespace=content_key(resume_sha, _role_line(job_description)) if resume_sha else None
+        )
+        
+        cached = self._question_cache.get(lookup.key)
+        if (cached is None and lookup.namespace
+                and self._question_cache.has_namespace(lookup.namespace)):
+            lookup.embedding = await self._embed_job_description(normalized_jd)
+            if lookup.embedding is not None:
+                # The similarity scan is pure Python; keep it off the event loop
+                cached = await asyncio.to_thread(
+                    self._question_cache.search, lookup.namespace, lookup.embedding
+                )
+        
+        return cached, lookup
+    
+    def _cache_result(self, lookup: _CacheLookup, result: QuestionGenerationResult) -> None:
+        """
+        Cache a generated question set.
+        
+        Entries that can be matched semantically get their job description
+        embedded in the background, off the request path.
+        """
+        if not result.questions:
+            return
+        
+        entry = replace(result, questions=list(result.questions), topics=list(result.topics))
+        self._question_cache.set(
+            lookup.key, entry, namespace=lookup.namespace or "", embedding=lookup.embedding
+        )
+        
+        if lookup.namespace and lookup.embedding is None:
+            task = asyncio.create_task(self._embed_cached_entry(lookup, entry))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    async def _embed_cached_entry(self, lookup: _CacheLookup, entry: QuestionGenerationResult) -> None:
+        """Attach a job description embedding to a cached question set."""
+        embedding = await self._embed_job_description(lookup.normalized_jd)
+        # Only if the entry is still cached as stored: re-setting it would
+        # renew its TTL, or bring back a set evicted or replaced meanwhile
+        if embedding is not None:
+            self._question_cache.attach_embedding(lookup.key, entry, embedding)
+    
+    def _from_cache(
+        self,
+        cached: QuestionGenerationResult,
+        candidate_name: str,
+        job_description: str
+    ) -> QuestionGenerationResult:
+        """Copy a cached result for a new request, with a fresh session_id."""
+        return replace(
+            cached,
+            session_id=new_session_id(),
+            candidate_name=candidate_name,
+            job_description=job_description,
+            questions=list(cached.questions),
+            topics=list(cached.topics)
+        )
+    
+    def _flow_payload(
+        self,
+        candidate_name: str,
+        job_description: str,
+        resume_pdf_path: Optional[str],
+        lookup: _CacheLookup
+    ) -> dict:
+        """Build the question flow's inputs."""
+        return {
+            "candidate_name": candidate_name,
+            "job_description": job_description,
+            "resume_pdf_path": resume_pdf_path or "",
+            "resume_sha": lookup.resume_sha
+        }
+    
+    def _flow_result(
+        self,
+        flow: GenerateInterviewQuestionsFlow,
+        candidate_name: str,
+        job_description: str
+    ) -> QuestionGenerationResult:
+        """Extract the generated questions from a finished flow's state."""
+        session_id = flow.state.session_id
+        questions = flow.state.questions
+        
+        logger.info("✅ Generated %d questions for session %s", len(questions), session_id)
+        
+        return QuestionGenerationResult(
+            session_id=session_id,
+            candidate_name=candidate_name,
+            job_description=job_description,
+            questions=questions,
+            topics=flow.state.interview_topics
+        )
+    
+    async def _embed_job_description(self, normalized_jd: str) -> Optional[List[float]]:
+        """Embed a job description for semantic cache lookups, if possible."""
+        try:
+            embeddings = await asyncio.to_thread(self.rag_service.embed_queries, [normalized_jd])
+            return embeddings[0]
+        except Exception as e:
+            logger.warning("⚠️ Could not embed job description for cache lookup: %s", e)
+            return None
+    
+    async def _run_flow(self, flow: GenerateInterviewQuestionsFlow, payload: dict) -> None:
+        """
+        Run the question generation flow and release its RAG session.
+        
+        Waits for a free flow slot first, so bursts of requests queue
+        instead of all starting crews at once.
+        
+        Args:
+            flow: The flow to run
+            payload: Flow inputs
+        """
+        try:
+            async with self._flow_slots:
+                await flow.kickoff_async(payload)
+        finally:
+            # The session only needs the resume vectors while questions
+            # are generated; detach it so sessions don't accumulate in
+            # the shared RAG service (the content-keyed collection stays
+            # on disk for identical re-uploads)
+            if payload.get("resume_pdf_path"):
+                await self._release_rag_session(flow.state.session_id)
+    
+    async def _release_rag_session(self, session_id: str) -> None:
+        """Detach a session from the RAG store."""
+        if session_id:
+            await asyncio.to_thread(self.rag_service.release_session, session_id)
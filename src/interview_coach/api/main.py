@@ -3,37 +3,80 @@
 Main FastAPI application for the Interview Coach API.
 """
 
+import asyncio
+import json
 import os
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from .middleware import AllowAllCORSMiddleware
 from .routes import router
 from .models import ErrorResponse
+from .interview_service import InterviewService
+from .evaluation_service import EvaluationService
 
 
-# Configure logging
+# Configure logging: QueueHandler still renders each message on the
+# calling thread, but the stdout write happens on a listener thread (started
+# in lifespan), so request handlers don't block on console I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        logging.handlers.QueueHandler(_log_queue),
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Pre-rendered /health body and when it next needs refreshing
+_health_cache = {"body": b"", "expires_at": 0.0}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    logger.info("🚀 Interview Coach API starting up...")
-    yield
-    logger.info("👋 Interview Coach API shutting down...")
+    _log_listener.start()
+    try:
+        logger.info("🚀 Interview Coach API starting up...")
+        
+        # Services are created once per server process (not at import), after
+        # logging is configured; route dependencies read them from app.state
+        app.state.interview_service = await asyncio.to_thread(InterviewService)
+        app.state.evaluation_service = EvaluationService()
+        
+        # Parse crew configs, build agents and open the embeddings connection
+        # once, before the first request
+        try:
+            await asyncio.gather(
+                asyncio.to_thread(app.state.interview_service.warm_up),
+                asyncio.to_thread(app.state.evaluation_service.warm_up),
+            )
+            logger.info("🔥 Services warmed up")
+        except Exception as e:
+            logger.warning("⚠️ Warm-up failed, initializing lazily instead: %s", e)
+        
+        # Build the OpenAPI schema now; FastAPI caches it on app.openapi_schema,
+        # so /openapi.json and /docs never pay for generation on a request
+        app.openapi()
+        
+        yield
+    finally:
+        logger.info("👋 Interview Coach API shutting down...")
+        _log_listener.stop()
 
 
 # Create FastAPI app
@@ -49,14 +92,8 @@ app = FastAPI(
     openapi_url="/openapi.json"
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware (allow-all; configure appropriately for production)
+app.add_middleware(AllowAllCORSMiddleware)
 
 
 # Include routers
@@ -86,11 +123,17 @@ async def root():
 )
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    # Load balancers poll this constantly; serve a pre-rendered body whose
+    # timestamp is refreshed at most once per second
+    now = time.monotonic()
+    if now >= _health_cache["expires_at"]:
+        _health_cache["body"] = json.dumps({
+            "status": "healthy",
+            "version": "1.0.0",
+            "timestamp": datetime.now().isoformat()
+        }).encode()
+        _health_cache["expires_at"] = now + 1.0
+    return Response(content=_health_cache["body"], media_type="application/json")
 
 
 # ============================================================================
@@ -100,7 +143,7 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled errors."""
-    logger.exception(f"Unhandled error: {exc}")
+    logger.exception("Unhandled error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -139,7 +182,14 @@ async def value_error_handler(request: Request, exc: ValueError):
 # ============================================================================
 
 def run_server(host: str = "0.0.0.0", port: int = 8080, reload: bool = False):
-    """Run the FastAPI server."""
+    """
+    Run the FastAPI server.
+    
+    Uses uvloop and the httptools parser (both installed with
+    uvicorn[standard]; uvloop is unavailable on Windows). For production,
+    run one worker per core, e.g. ``uvicorn interview_coach.api.main:app
+    --workers $(nproc)``.
+    """
     
     from langfuse import get_client
  
@@ -162,7 +212,12 @@ def run_server(host: str = "0.0.0.0", port: int = 8080, reload: bool = False):
         host=host,
         port=port,
         reload=reload,
-        log_level="info"
+        log_level="info",
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        timeout_keep_alive=30,
+        backlog=2048,
+        limit_concurrency=512
     )
 
 
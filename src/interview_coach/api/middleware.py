@@ -0,0 +1,99 @@
+# ASGI Middleware
+"""
+Lightweight ASGI middleware for the Interview Coach API.
+"""
+
+from typing import List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+
+
+class AllowAllCORSMiddleware:
+    """
+    CORS for an allow-all policy without per-request header parsing.
+
+    Behaves like Starlette's ``CORSMiddleware`` configured with every
+    origin, method and header allowed (plus credentials): responses carry
+    ``Access-Control-Allow-Origin: *``, and the request's ``Origin`` is only
+    echoed back (with credentials allowed) when the request sends cookies.
+    Preflights are answered directly instead of validating each request
+    against configured lists.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        has_cookie = False
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            # As in Starlette with credentials allowed, preflights echo the
+            # origin so a credentialed request may follow
+            headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+                (b"access-control-allow-methods", _ALLOW_METHODS),
+                (b"access-control-max-age", _PREFLIGHT_MAX_AGE),
+                (b"content-length", b"2"),
+                (b"content-type", b"text/plain; charset=utf-8"),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        # Credentials cannot be combined with "*", so cookie-bearing requests
+        # get their own origin back instead
+        if has_cookie:
+            cors_headers: List[Tuple[bytes, bytes]] = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+            ]
+        else:
+            cors_headers = [(b"access-control-allow-origin", b"*")]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", [])) + cors_headers
+                if has_cookie:
+                    headers = _add_vary_origin(headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+def _add_vary_origin(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Add ``Origin`` to the response's Vary header, merging with any existing one."""
+    for i, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            if b"origin" not in value.lower():
+                headers[i] = (name, value + b", Origin")
+            return headers
+    headers.append((b"vary", b"Origin"))
+    return headers
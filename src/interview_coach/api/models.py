@@ -9,7 +9,57 @@ Simplified models for stateless service:
 
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# ============================================================================
+# OpenAPI Examples
+# ============================================================================
+
+_START_INTERVIEW_EXAMPLE = {
+    "session_id": "session_20260106_143022",
+    "status": "ready",
+    "message": "Interview questions generated successfully. Use POST /evaluate to evaluate responses.",
+    "candidate_name": "John Doe",
+    "total_questions": 6,
+    "questions": [
+        "Describe a challenging Python project you led.",
+        "How do you ensure code quality in critical systems?"
+    ]
+}
+
+_ERROR_EXAMPLE = {
+    "error": "ValidationError",
+    "detail": "Job description must be at least 50 characters"
+}
+
+_QUESTION_ANSWER_PAIR_EXAMPLE = {
+    "question": "Tell me about a challenging Python project you led.",
+    "answer": "I led a migration of our monolithic application to microservices using FastAPI..."
+}
+
+_EVALUATION_REQUEST_EXAMPLE = {
+    "job_description": "We are looking for a Senior Python Developer with 5+ years of experience in building scalable web applications. The ideal candidate should have strong experience with FastAPI, async programming, and microservices architecture...",
+    "transcript": [
+        {
+            "question": "Tell me about a challenging Python project you led.",
+            "answer": "I led a migration of our monolithic application to microservices..."
+        },
+        {
+            "question": "How do you ensure code quality in critical systems?",
+            "answer": "We adopted a testing pyramid approach with unit tests, integration tests..."
+        }
+    ],
+    "candidate_name": "John Doe"
+}
+
+_EVALUATION_RESPONSE_EXAMPLE = {
+    "evaluation_report": "## 🌟 Executive Summary\n\nGreat job demonstrating your technical depth...",
+    "candidate_name": "John Doe",
+    "questions_evaluated": 6,
+    "evaluated_at": "2026-01-06T14:30:00",
+    "scores": {"technical": 8.5, "communication": 9.0, "overall": 8.7}
+}
 
 
 # ============================================================================
@@ -25,21 +75,7 @@ class StartInterviewResponse(BaseModel):
     total_questions: int
     questions: List[str]
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "session_id": "session_20260106_143022",
-                "status": "ready",
-                "message": "Interview questions generated successfully. Use POST /evaluate to evaluate responses.",
-                "candidate_name": "John Doe",
-                "total_questions": 6,
-                "questions": [
-                    "Describe a challenging Python project you led.",
-                    "How do you ensure code quality in critical systems?"
-                ]
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _START_INTERVIEW_EXAMPLE})
 
 
 # ============================================================================
@@ -51,14 +87,7 @@ class ErrorResponse(BaseModel):
     error: str
     detail: str
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "error": "ValidationError",
-                "detail": "Job description must be at least 50 characters"
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _ERROR_EXAMPLE})
 
 
 # ============================================================================
@@ -70,14 +99,7 @@ class QuestionAnswerPairModel(BaseModel):
     question: str = Field(..., description="The interview question asked", min_length=1)
     answer: str = Field(..., description="The candidate's response to the question", min_length=1)
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "question": "Tell me about a challenging Python project you led.",
-                "answer": "I led a migration of our monolithic application to microservices using FastAPI..."
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _QUESTION_ANSWER_PAIR_EXAMPLE})
 
 
 class StandaloneEvaluationRequest(BaseModel):
@@ -97,24 +119,7 @@ class StandaloneEvaluationRequest(BaseModel):
         description="Optional name of the candidate being evaluated"
     )
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "job_description": "We are looking for a Senior Python Developer with 5+ years of experience in building scalable web applications. The ideal candidate should have strong experience with FastAPI, async programming, and microservices architecture...",
-                "transcript": [
-                    {
-                        "question": "Tell me about a challenging Python project you led.",
-                        "answer": "I led a migration of our monolithic application to microservices..."
-                    },
-                    {
-                        "question": "How do you ensure code quality in critical systems?",
-                        "answer": "We adopted a testing pyramid approach with unit tests, integration tests..."
-                    }
-                ],
-                "candidate_name": "John Doe"
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _EVALUATION_REQUEST_EXAMPLE})
 
 
 class StandaloneEvaluationResponse(BaseModel):
@@ -125,14 +130,4 @@ class StandaloneEvaluationResponse(BaseModel):
     evaluated_at: datetime = Field(..., description="Timestamp when evaluation was completed")
     scores: Dict[str, Any] = Field(default_factory=dict, description="Optional parsed scores")
     
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "evaluation_report": "## 🌟 Executive Summary\n\nGreat job demonstrating your technical depth...",
-                "candidate_name": "John Doe",
-                "questions_evaluated": 6,
-                "evaluated_at": "2026-01-06T14:30:00",
-                "scores": {"technical": 8.5, "communication": 9.0, "overall": 8.7}
-            }
-        }
-    }
+    model_config = ConfigDict(json_schema_extra={"example": _EVALUATION_RESPONSE_EXAMPLE})
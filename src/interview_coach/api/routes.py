@@ -2,16 +2,26 @@
 """
 FastAPI route handlers for the Interview Coach API.
 
-Simplified stateless service with only two endpoints:
+Simplified stateless service with two core endpoints:
 1. POST /sessions - Generate interview questions
+   (POST /sessions/stream streams each question as Server-Sent Events)
 2. POST /evaluate - Evaluate interview transcript
+   (POST /evaluate/stream streams the same report as Server-Sent Events)
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Callable, Coroutine, Dict, Tuple
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+import pydantic_core
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, UploadFile, File, Form
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 
 from .models import (
     StartInterviewResponse,
@@ -19,45 +29,154 @@ from .models import (
     StandaloneEvaluationRequest,
     StandaloneEvaluationResponse,
 )
-from .interview_service import InterviewService, interview_service
-from .evaluation_service import (
-    EvaluationService,
-    evaluation_service,
-    QuestionAnswerPair,
-)
+from .interview_service import InterviewService
+from .evaluation_service import EvaluationService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["interview"])
+
+class FastJSONRequest(Request):
+    """Request whose JSON body is decoded by pydantic-core's native parser."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            try:
+                self._json = pydantic_core.from_json(body)
+            except ValueError as e:
+                # FastAPI maps JSONDecodeError to its usual 422 response
+                raise json.JSONDecodeError(str(e), body.decode(errors="replace"), 0) from e
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    """Route that parses JSON bodies with FastJSONRequest instead of stdlib json."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def fast_json_handler(request: Request) -> Response:
+            return await handler(FastJSONRequest(request.scope, request.receive))
+
+        return fast_json_handler
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's native serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["interview"],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 RESUME_UPLOAD_DIR = Path("uploads/resumes")
-RESUME_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 ALLOWED_RESUME_EXTENSIONS = {".pdf"}
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+PDF_MAGIC = b"%PDF-"
 
+# Upload directory is created on first upload rather than at import
+_upload_dir_ready = False
+
+
+async def _save_resume_upload(file: UploadFile) -> Tuple[str, str]:
+    """
+    Copy an uploaded resume PDF to disk.
 
-async def _save_resume_upload(file: UploadFile) -> str:
-    """Persist an uploaded resume PDF and return the stored path."""
+    Starlette has already spooled the upload into ``file.file``; it is
+    copied in large chunks on a worker thread (bounded memory, no
+    per-chunk event-loop hops) and hashed in the same pass, then stored
+    as ``<sha256>.pdf`` so repeat uploads of one resume share a single file.
+
+    Returns:
+        (stored path, SHA256 hex digest of the file)
+    """
     filename = Path(file.filename or "resume").name
     suffix = Path(filename).suffix.lower()
     if suffix not in ALLOWED_RESUME_EXTENSIONS:
         raise ValueError("Only PDF resume uploads are supported.")
 
-    target_path = RESUME_UPLOAD_DIR / f"{uuid4().hex}_{filename}"
-    content = await file.read()
-    target_path.write_bytes(content)
-    await file.close()
-    logger.info(f"Saved uploaded resume to {target_path}")
-    return str(target_path.resolve())
+    try:
+        target_path, resume_sha, stored = await asyncio.to_thread(
+            _store_resume, file.file, suffix
+        )
+    finally:
+        await file.close()
+
+    if stored:
+        logger.info("Saved uploaded resume to %s", target_path)
+    else:
+        logger.info("Resume already stored at %s", target_path)
+    return str(target_path.resolve()), resume_sha
+
+
+def _store_resume(source: BinaryIO, suffix: str) -> Tuple[Path, str, bool]:
+    """
+    Copy and hash a resume into content-addressed storage (blocking).
+
+    Returns:
+        (stored path, SHA256 hex digest, whether a new file was written)
+    """
+    # Reject non-PDF bodies before anything is written or parsed
+    source.seek(0)
+    if source.read(len(PDF_MAGIC)) != PDF_MAGIC:
+        raise ValueError("Uploaded resume is not a valid PDF file.")
+
+    global _upload_dir_ready
+    if not _upload_dir_ready:
+        RESUME_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        _upload_dir_ready = True
+
+    temp_path = RESUME_UPLOAD_DIR / f".{uuid4().hex}.part"
+    sha256 = hashlib.sha256()
+    size = 0
+
+    try:
+        source.seek(0)
+        with temp_path.open("wb") as out:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_RESUME_BYTES:
+                    raise ValueError(
+                        f"Resume exceeds the {MAX_RESUME_BYTES // (1024 * 1024)} MB upload limit."
+                    )
+                sha256.update(chunk)
+                out.write(chunk)
+
+        resume_sha = sha256.hexdigest()
+        target_path = RESUME_UPLOAD_DIR / f"{resume_sha}{suffix}"
+
+        if target_path.exists():
+            # Same name means same bytes: keep the stored copy
+            temp_path.unlink()
+            return target_path, resume_sha, False
+
+        os.replace(temp_path, target_path)
+        return target_path, resume_sha, True
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
-def get_interview_service():
-    """Dependency to get the global interview service singleton."""
-    return interview_service
+def get_interview_service(request: Request) -> InterviewService:
+    """Dependency to get the app's interview service (created in lifespan)."""
+    return request.app.state.interview_service
 
 
-def get_evaluation_service():
-    """Dependency to get the global evaluation service singleton."""
-    return evaluation_service
+def get_evaluation_service(request: Request) -> EvaluationService:
+    """Dependency to get the app's evaluation service (created in lifespan)."""
+    return request.app.state.evaluation_service
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + pydantic_core.to_json(data) + b"\n\n"
 
 
 # ============================================================================
@@ -98,13 +217,15 @@ async def start_interview(
     """
     try:
         resume_path = None
+        resume_sha = None
         if resume_pdf is not None:
-            resume_path = await _save_resume_upload(resume_pdf)
+            resume_path, resume_sha = await _save_resume_upload(resume_pdf)
 
         result = await service.generate_questions(
             candidate_name=candidate_name,
             job_description=job_description,
-            resume_pdf_path=resume_path
+            resume_pdf_path=resume_path,
+            resume_sha=resume_sha
         )
         
         return StartInterviewResponse(
@@ -119,8 +240,86 @@ async def start_interview(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"Error generating questions: {e}")
+        logger.exception("Error generating questions: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to generate questions: {str(e)}")
+
+
+@router.post(
+    "/sessions/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+    summary="Generate interview questions (streamed)",
+    description="""
+    Same inputs as POST /sessions, with each question delivered as a
+    Server-Sent Event as soon as it is generated.
+    
+    Events:
+    - `question`: one question (`index` in the final topic order, `question`),
+      in completion order
+    - `done`: `total_questions` once every question has been sent
+    - `error`: generation failed after the stream started
+    """,
+    tags=["questions"]
+)
+async def start_interview_stream(
+    candidate_name: str = Form("Candidate"),
+    job_description: str = Form(..., min_length=50),
+    resume_pdf: UploadFile | None = File(None),
+    service: InterviewService = Depends(get_interview_service)
+) -> StreamingResponse:
+    """
+    Stream interview questions as Server-Sent Events.
+    
+    The first question is sent as soon as the fastest generation finishes
+    instead of after the slowest; batch callers should keep using /sessions.
+    """
+    try:
+        resume_path = None
+        resume_sha = None
+        if resume_pdf is not None:
+            resume_path, resume_sha = await _save_resume_upload(resume_pdf)
+        
+        questions = service.stream_questions(
+            candidate_name=candidate_name,
+            job_description=job_description,
+            resume_pdf_path=resume_path,
+            resume_sha=resume_sha
+        )
+        
+        # Wait for the first question here so failures before any output
+        # still get a plain error response
+        first_question = await anext(questions, None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error generating questions: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate questions: {str(e)}")
+    
+    async def event_stream() -> AsyncIterator[bytes]:
+        if first_question is None:
+            yield _sse_event("done", {"total_questions": 0})
+            return
+        
+        total = 1
+        yield _sse_event("question", {"index": first_question[0], "question": first_question[1]})
+        try:
+            async for index, question in questions:
+                total += 1
+                yield _sse_event("question", {"index": index, "question": question})
+        except Exception as e:
+            logger.exception("Streamed question generation error: %s", e)
+            yield _sse_event("error", {"detail": str(e)})
+            return
+        yield _sse_event("done", {"total_questions": total})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # ============================================================================
@@ -162,19 +361,11 @@ async def evaluate_transcript(
     - Testing different evaluation criteria
     """
     try:
-        # Convert request models to service dataclasses
-        transcript = [
-            QuestionAnswerPair(
-                question=qa.question,
-                answer=qa.answer
-            )
-            for qa in request.transcript
-        ]
-        
-        # Run evaluation
+        # The validated request models are passed through as-is; the
+        # service only reads their question/answer attributes
         result = await service.evaluate(
             job_description=request.job_description,
-            transcript=transcript,
+            transcript=request.transcript,
             candidate_name=request.candidate_name
         )
         
@@ -189,8 +380,64 @@ async def evaluate_transcript(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
-        logger.exception(f"Evaluation error: {e}")
+        logger.exception("Evaluation error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.exception(f"Unexpected error during evaluation: {e}")
+        logger.exception("Unexpected error during evaluation: %s", e)
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
+
+
+@router.post(
+    "/evaluate/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse},
+    },
+    summary="Evaluate an interview transcript (streamed)",
+    description="""
+    Same evaluation as POST /evaluate, delivered as Server-Sent Events.
+    
+    Events:
+    - `started`: the request was accepted and the evaluation is running
+    - `section`: one report section (`title`, `content`), in report order
+    - `done`: evaluation metadata once every section has been sent
+    - `error`: the evaluation failed after the stream started
+    """,
+    tags=["evaluation"]
+)
+async def evaluate_transcript_stream(
+    request: StandaloneEvaluationRequest,
+    service: EvaluationService = Depends(get_evaluation_service)
+) -> StreamingResponse:
+    """
+    Stream an interview evaluation as Server-Sent Events.
+    
+    The response starts immediately with a "started" event instead of
+    waiting for the whole report; batch callers should keep using /evaluate.
+    """
+    events = service.evaluate_stream(
+        job_description=request.job_description,
+        transcript=request.transcript,
+        candidate_name=request.candidate_name
+    )
+    
+    # Pull the first event here so invalid requests still get a plain 400
+    try:
+        first_event = await anext(events)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def event_stream() -> AsyncIterator[bytes]:
+        yield _sse_event(*first_event)
+        try:
+            async for event in events:
+                yield _sse_event(*event)
+        except Exception as e:
+            logger.exception("Streamed evaluation error: %s", e)
+            yield _sse_event("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
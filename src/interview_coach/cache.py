@@ -0,0 +1,249 @@
+"""
+In-process caches for the interview flows and services.
+
+Provides a small thread-safe LRU cache with optional expiry, a semantic
+cache that can also match entries by embedding similarity, plus helpers
+to build stable content-hash keys from request text.
+"""
+
+import hashlib
+import math
+import re
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for cache lookups (lowercase, collapsed whitespace).
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def content_key(*parts: str) -> str:
+    """
+    Build a stable cache key from one or more text parts.
+
+    Args:
+        *parts: Text parts identifying the cached value
+
+    Returns:
+        SHA256 hex digest of the parts
+    """
+    return hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with optional per-entry expiry.
+
+    Entries beyond ``maxsize`` are evicted least recently used first, and
+    entries older than ``ttl`` seconds are dropped when accessed.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Entry lifetime in seconds (None = no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            stored_at, value = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def update(self, key: Hashable, func: Callable[[Any], Any]) -> bool:
+        """
+        Replace a live entry's value with ``func(value)``, in place.
+
+        The entry keeps its age and LRU position. ``func`` runs under the
+        cache lock and may return None to leave the entry unchanged.
+
+        Returns:
+            True if the entry was replaced
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False
+
+            stored_at, value = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                return False
+
+            new_value = func(value)
+            if new_value is None:
+                return False
+            self._data[key] = (stored_at, new_value)
+            return True
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Return a snapshot of unexpired (key, value) pairs, oldest first."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (stored_at, value) in self._data.items()
+                if self.ttl is None or now - stored_at <= self.ttl
+            ]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return the value for key."""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SemanticCache:
+    """
+    Cache keyed by exact content, with a fallback lookup by embedding.
+
+    Each entry belongs to a namespace (e.g. a resume hash) and may carry an
+    embedding; ``search`` returns the value of the most similar entry in
+    the namespace whose cosine similarity reaches ``threshold``.
+    """
+
+    def __init__(self,
+                 threshold: float = 0.93,
+                 maxsize: int = 256,
+                 ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a semantic hit
+            maxsize: Maximum number of entries to keep
+            ttl: Entry lifetime in seconds (None = no expiry)
+        """
+        self.threshold = threshold
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value stored under an exact key."""
+        entry = self._entries.get(key)
+        return default if entry is None else entry[2]
+
+    def search(self,
+               namespace: str,
+               embedding: Sequence[float],
+               default: Any = None) -> Any:
+        """
+        Return the value of the closest entry in a namespace.
+
+        Args:
+            namespace: Namespace to search
+            embedding: Query embedding
+            default: Value returned when nothing is similar enough
+
+        Returns:
+            The best matching value, or default
+        """
+        query = _unit(embedding)
+        best_key, best_score = None, self.threshold
+
+        for key, (entry_namespace, vector, _) in self._entries.items():
+            if entry_namespace != namespace or vector is None:
+                continue
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        return default if best_key is None else self.get(best_key, default)
+
+    def has_namespace(self, namespace: str) -> bool:
+        """Return True if any live entry with an embedding is in the namespace."""
+        return any(
+            entry_namespace == namespace and vector is not None
+            for _, (entry_namespace, vector, _) in self._entries.items()
+        )
+
+    def set(self,
+            key: Hashable,
+            value: Any,
+            namespace: str = "",
+            embedding: Optional[Sequence[float]] = None) -> None:
+        """
+        Store a value under an exact key.
+
+        Args:
+            key: Exact content key
+            value: Value to cache
+            namespace: Namespace the entry belongs to
+            embedding: Optional embedding used by ``search``
+        """
+        vector = _unit(embedding) if embedding else None
+        self._entries.set(key, (namespace, vector, value))
+
+    def attach_embedding(self,
+                         key: Hashable,
+                         value: Any,
+                         embedding: Sequence[float]) -> bool:
+        """
+        Add an embedding to the entry under key if it still holds value.
+
+        The entry keeps its age and LRU position; an entry that was evicted
+        or replaced since value was stored is left alone.
+
+        Returns:
+            True if the embedding was attached
+        """
+        vector = _unit(embedding)
+
+        def attach(entry: tuple) -> Optional[tuple]:
+            namespace, _, current = entry
+            return (namespace, vector, current) if current is value else None
+
+        return self._entries.update(key, attach)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _unit(vector: Sequence[float]) -> Tuple[float, ...]:
+    """Scale a vector to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return tuple(x / norm for x in vector)
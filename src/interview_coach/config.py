@@ -0,0 +1,36 @@
+"""
+Environment-driven settings for the Interview Coach.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or not an integer
+        minimum: Smallest accepted value; lower values are raised to it
+
+    Returns:
+        The parsed value, at least ``minimum``
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("⚠️ Ignoring %s=%r (not an integer); using %d", name, raw, default)
+        return default
+
+    if value < minimum:
+        logger.warning("⚠️ %s=%d is below %d; using %d", name, value, minimum, minimum)
+        return minimum
+    return value
@@ -8,28 +8,74 @@ langfuse = get_client()
 import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List
+from uuid import uuid4
 
-from crewai import LLM
+from crewai import Crew
 from pydantic import BaseModel
 from crewai.flow import Flow, listen, start, and_
 
+from interview_coach.cache import TTLCache, content_key, normalize_text
+from interview_coach.config import env_int
 from interview_coach.crews.supervisor_crew.supervisor_crew import SupervisorCrew
 from interview_coach.crews.interview_crew.interview_crew import InterviewCrew
-from rag.rag_service import ResumeRAGService
+from rag.rag_service import get_rag_service
 
 logger = logging.getLogger(__name__)
 
+# Roadmap topics keyed by normalized job description, so repeat postings
+# (same role, many candidates) skip the supervisor crew entirely
+_roadmap_cache = TTLCache(maxsize=512, ttl=24 * 3600)
+
+# Generated questions keyed by (topic, resume context), so topics shared
+# between roadmaps for the same resume are only generated once
+_question_cache = TTLCache(maxsize=2048, ttl=24 * 3600)
+
+# Cap on simultaneous question-generation LLM calls per flow, so long
+# roadmaps don't trip provider rate limits (and their retry backoff)
+MAX_QUESTION_CONCURRENCY = env_int("INTERVIEW_MAX_CONCURRENCY", 8)
+
+
+def new_session_id() -> str:
+    """Create a unique, time-ordered interview session ID."""
+    # The random suffix keeps sessions started in the same second apart
+    return f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+
+
+@lru_cache(maxsize=1)
+def _supervisor_crew() -> Crew:
+    """Build the SupervisorCrew once; callers run a copy of it."""
+    return SupervisorCrew().crew()
+
+
+@lru_cache(maxsize=1)
+def _interview_crew() -> Crew:
+    """Build the InterviewCrew once; callers run a copy of it."""
+    return InterviewCrew().crew()
+
+
+def warm_up_crews() -> None:
+    """Build the flow's crew templates ahead of the first run."""
+    _supervisor_crew()
+    _interview_crew()
+
+
 # ============================================================================
 # State Models
 # ============================================================================
 
 
 class InterviewSessionState(BaseModel):
-    """State for an API-driven interview session."""
+    """State for an API-driven interview session.
+
+    Kept as a pydantic model: CrewAI flows only accept BaseModel (or dict)
+    state, and a flow instance lives for a single request.
+    """
     # Input data
     resume_pdf_path: str = ""
+    resume_sha: str = ""
     job_description: str = ""
     candidate_name: str = "Candidate"
 
@@ -37,7 +83,8 @@ class InterviewSessionState(BaseModel):
     session_id: str = ""
     timestamp: str = ""
 
-    # Interview roadmap
+    # Interview roadmap; resume_contexts and questions are index-aligned
+    # with interview_topics once their steps have run
     interview_topics: List[str] = []
     resume_contexts: List[str] = []
 
@@ -55,7 +102,7 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
     
     This flow is designed to work with the FastAPI backend:
     1. Initialize session with JD and resume
-    2. Generate interview roadmap
+    2. Generate interview roadmap (in parallel with resume ingestion)
     3. For each question:
        - Generate question
        - Wait for candidate response (via API)
@@ -63,10 +110,12 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
     4. Run evaluation
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, rag_service=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.rag_service = ResumeRAGService()
-        self.llm = LLM(model="gemini/gemini-2.5-flash-lite")
+        self.rag_service = rag_service or get_rag_service()
+        # (index, question) pairs, published as soon as each question is
+        # ready so callers can stream them before the whole flow finishes
+        self.question_stream: asyncio.Queue = asyncio.Queue()
 
     # ========================================================================
     # Initialization Phase
@@ -78,46 +127,19 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
         logger.info("🚀 Preparing interview session...")
 
         # Generate session metadata
-        self.state.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.state.session_id = new_session_id()
         self.state.timestamp = datetime.now().isoformat()
 
         logger.info(f"📋 Session ID: {self.state.session_id}")
         logger.info(f"👤 Candidate: {self.state.candidate_name}")
 
     @listen(prepare_session)
-    def preprocess_job_description(self):
-        """Clean and preprocess the job description."""
-        logger.info("🧹 Cleaning job description...")
-
-        with langfuse.start_as_current_observation(
-                as_type="span", name="preprocess_job_description") as span:
-            with propagate_attributes(session_id=self.state.session_id,
-                                      user_id=self.state.candidate_name,
-                                      trace_name="Generate Questions Flow"):
-                response = self.llm.call(messages=[{
-                    "role":
-                    "system",
-                    "content":
-                    ("You are a text preprocessing assistant. "
-                     "Clean and preprocess job description text by removing all "
-                     "unnecessary details. Focus on technical aspects only. "
-                     "Remove all legal and HR-related content.")
-                }, {
-                    "role":
-                    "user",
-                    "content":
-                    f"Please clean the following job description:\n\n{self.state.job_description}"
-                }], )
-                span.update(
-                    input={"job_description": self.state.job_description},
-                    output={"cleaned_job_description": response})
-
-        self.state.job_description = response
-        logger.info("✅ Job description cleaned")
+    async def ingest_resume_to_rag(self):
+        """Ingest resume PDF into RAG system if provided.
 
-    @listen(prepare_session)
-    def ingest_resume_to_rag(self):
-        """Ingest resume PDF into RAG system if provided."""
+        PDF parsing and embedding are blocking, so they run on a worker
+        thread to overlap with the roadmap LLM call.
+        """
         if not self.state.resume_pdf_path:
             logger.info("📝 No PDF provided - skipping RAG ingestion")
             return
@@ -132,47 +154,81 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
         try:
             with langfuse.start_as_current_observation(
                     as_type="span", name="ingest_resume_to_rag") as span:
-                result = self.rag_service.ingest_pdf_resume(
+                result = await asyncio.to_thread(
+                    self.rag_service.ingest_pdf_resume,
                     pdf_path=str(pdf_path),
                     session_id=self.state.session_id,
                     metadata={
                         "candidate_name": self.state.candidate_name,
                         "timestamp": self.state.timestamp
-                    })
+                    },
+                    file_hash=self.state.resume_sha or None)
                 span.update(input={"pdf_path": str(pdf_path)},
                             output={
                                 "num_chunks":
                                 result.get("num_chunks") if isinstance(
                                     result, dict) else None,
+                                "reused": result.get("reused") if isinstance(
+                                    result, dict) else None,
                                 "status":
                                 "success"
                             })
 
-            logger.info(f"✅ Resume ingested: {result['num_chunks']} chunks")
+            if result.get("reused"):
+                logger.info(
+                    f"♻️ Resume already indexed: reusing {result['num_chunks']} chunks"
+                )
+            else:
+                logger.info(f"✅ Resume ingested: {result['num_chunks']} chunks")
         except Exception as e:
             logger.error(f"⚠️ Error ingesting resume: {e}")
 
-    @listen(and_(ingest_resume_to_rag, preprocess_job_description))
-    def create_interview_roadmap(self):
-        """Generate interview roadmap using SupervisorCrew."""
+    @listen(prepare_session)
+    async def create_interview_roadmap(self):
+        """Generate interview roadmap using SupervisorCrew.
+
+        The raw job description is passed straight to the supervisor, whose
+        prompt already discards HR/legal boilerplate, so no separate
+        cleaning call is needed before the roadmap.
+        """
         logger.info("🗺️ Creating interview roadmap...")
         try:
             with langfuse.start_as_current_observation(
                     as_type="span", name="create_interview_roadmap") as span:
-                result = (SupervisorCrew().crew().kickoff(
-                    inputs={"job_description": self.state.job_description}))
-
-                # Attempt to extract topics from the crew result
-                try:
-                    topics = result.pydantic.interview_topics  # type: ignore
-                except Exception:
-                    topics = []
+                jd_key = content_key(normalize_text(self.state.job_description))
+                cached_topics = _roadmap_cache.get(jd_key)
+
+                if cached_topics is not None:
+                    logger.info("♻️ Reusing cached roadmap for this job description")
+                    topics = list(cached_topics)
+                    status = "cache_hit"
+                else:
+                    with propagate_attributes(session_id=self.state.session_id,
+                                              user_id=self.state.candidate_name,
+                                              trace_name="Generate Questions Flow"):
+                        # Crew copy and kickoff both block; run them together
+                        # on a worker thread (contextvars carry the trace)
+                        result = await asyncio.to_thread(
+                            lambda: _supervisor_crew().copy().kickoff(
+                                inputs={
+                                    "job_description": self.state.job_description
+                                }))
+
+                    # Attempt to extract topics from the crew result
+                    try:
+                        topics = result.pydantic.interview_topics  # type: ignore
+                    except Exception:
+                        topics = []
+
+                    if topics:
+                        _roadmap_cache.set(jd_key, list(topics))
+                    status = "success"
 
                 span.update(
                     input={"job_description": self.state.job_description},
                     output={
                         "interview_topics": topics,
-                        "status": "success"
+                        "status": status
                     })
 
             # Assign and log topics after successful span
@@ -186,55 +242,56 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
             logger.error(f"⚠️ Error extracting topics: {e}")
             self.state.interview_topics = []
 
-    @listen(create_interview_roadmap)
-    def prepare_resume_contexts(self):
-        """Retrieve resume context for each topic."""
+    @listen(and_(ingest_resume_to_rag, create_interview_roadmap))
+    async def prepare_resume_contexts(self):
+        """Retrieve resume context for all topics in one batched query.
+
+        The embedding request and vector search are blocking, so they run
+        on a worker thread to keep the event loop free for other requests.
+        """
         logger.info("📚 Retrieving resume context for each topic...")
 
-        self.state.resume_contexts = []
+        topics = self.state.interview_topics
+        contexts = [""] * len(topics)
 
-        for topic in self.state.interview_topics:
-            context = ""
-            try:
-                with langfuse.start_as_current_observation(
-                        as_type="span", name="prepare_resume_context") as span:
-                    if self.state.resume_pdf_path:
+        try:
+            with langfuse.start_as_current_observation(
+                    as_type="span", name="prepare_resume_contexts") as span:
+                if self.state.resume_pdf_path and topics:
+                    try:
+                        results = await asyncio.to_thread(
+                            self.rag_service.retrieve_contexts_batch,
+                            queries=topics,
+                            session_id=self.state.session_id,
+                            k=3)
+                        contexts = ["\n".join(chunks) for chunks in results]
+                        span.update(input={"topics": topics},
+                                    output={
+                                        "resume_contexts": contexts,
+                                        "status": "success"
+                                    })
+                    except Exception as e:
+                        logger.warning(f"RAG batch query failed: {e}")
+                        contexts = [""] * len(topics)
                         try:
-                            results = self.rag_service.retrieve_context(
-                                query=topic,
-                                session_id=self.state.session_id,
-                                k=3)
-                            context = "\n".join(results)
-                            span.update(input={"topic": topic},
+                            span.update(input={"topics": topics},
                                         output={
-                                            "resume_context": context,
-                                            "status": "success"
+                                            "error": str(e),
+                                            "status": "error"
                                         })
-                        except Exception as e:
-                            logger.warning(
-                                f"RAG query failed for '{topic}': {e}")
-                            context = ""
-                            try:
-                                span.update(input={"topic": topic},
-                                            output={
-                                                "error": str(e),
-                                                "status": "error"
-                                            })
-                            except Exception:
-                                pass
-                    else:
-                        # No resume provided; still record an observation
-                        span.update(input={"topic": topic},
-                                    output={
-                                        "resume_context": "",
-                                        "status": "no_resume"
-                                    })
-            except Exception as e:
-                logger.warning(
-                    f"Failed to record span for topic '{topic}': {e}")
+                        except Exception:
+                            pass
+                else:
+                    # No resume provided; still record an observation
+                    span.update(input={"topics": topics},
+                                output={
+                                    "resume_contexts": contexts,
+                                    "status": "no_resume"
+                                })
+        except Exception as e:
+            logger.warning(f"Failed to record span for resume contexts: {e}")
 
-            print(topic, context)
-            self.state.resume_contexts.append(context)
+        self.state.resume_contexts = contexts
 
         logger.info("✅ Resume contexts retrieved")
 
@@ -243,27 +300,27 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
         """Generate all interview questions upfront in parallel."""
         logger.info("❓ Generating all interview questions in parallel...")
 
-        inputs = []
-
-        for i, topic in enumerate(self.state.interview_topics):
-            resume_context = (self.state.resume_contexts[i]
-                              if i < len(self.state.resume_contexts) else "")
-
-            input_data = {
-                "current_topic": topic,
-                "resume_context": resume_context
-                or "No resume context available.",
-                "candidate_name": self.state.candidate_name,
-                "session_id": self.state.session_id,
-            }
-            inputs.append(input_data)
+        # prepare_resume_contexts always leaves one context per topic
+        inputs = [{
+            "current_topic": topic,
+            "resume_context": resume_context or "No resume context available.",
+            "candidate_name": self.state.candidate_name,
+            "session_id": self.state.session_id,
+        } for topic, resume_context in zip(self.state.interview_topics,
+                                           self.state.resume_contexts)]
 
         with langfuse.start_as_current_observation(
                 as_type="span", name="generate_all_questions") as span:
-            results = await InterviewCrew().crew().akickoff_for_each(
-                inputs=inputs)
-
-            self.state.questions = [result.raw.strip() for result in results] # type: ignore
+            # One task per topic, at most MAX_QUESTION_CONCURRENCY running at
+            # once, each publishing its question when done; gather keeps the
+            # stored questions aligned with the topic order.
+            semaphore = asyncio.Semaphore(MAX_QUESTION_CONCURRENCY)
+            tasks = [
+                asyncio.create_task(
+                    self._generate_question(i, input_data, semaphore))
+                for i, input_data in enumerate(inputs)
+            ]
+            self.state.questions = list(await asyncio.gather(*tasks))
 
             span.update(input={"topics": self.state.interview_topics},
                         output={
@@ -273,3 +330,26 @@ class GenerateInterviewQuestionsFlow(Flow[InterviewSessionState]):
 
         logger.info(
             f"✅ All {len(self.state.questions)} questions generated and ready")
+
+    async def _generate_question(self, index: int, input_data: dict,
+                                 semaphore: asyncio.Semaphore) -> str:
+        """Generate the interview question for a single topic."""
+        question_key = content_key(normalize_text(input_data["current_topic"]),
+                                   input_data["resume_context"])
+        question = _question_cache.get(question_key)
+
+        if question is None:
+            async with semaphore:
+                # Crew copy and kickoff both block; run them together on a
+                # worker thread, as for the roadmap
+                result = await asyncio.to_thread(
+                    lambda: _interview_crew().copy().kickoff(inputs=input_data))
+            question = result.raw.strip()  # type: ignore
+            if question:
+                _question_cache.set(question_key, question)
+        else:
+            logger.info(f"♻️ Reusing cached question {index + 1}")
+
+        self.question_stream.put_nowait((index, question))
+        logger.info(f"❓ Question {index + 1} ready")
+        return question
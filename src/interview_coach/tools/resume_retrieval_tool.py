@@ -11,7 +11,7 @@ from pydantic import BaseModel, Field
 
 from crewai.tools import BaseTool
 
-from rag.rag_service import ResumeRAGService
+from rag.rag_service import ResumeRAGService, get_rag_service
 
 
 class ResumeRetrievalInput(BaseModel):
@@ -47,28 +47,37 @@ class ResumeRetrievalTool(BaseTool):
     )
     args_schema: Type[BaseModel] = ResumeRetrievalInput
     
-    # RAG service instance (can be injected or created)
+    # RAG service instance (injected, or the process-wide shared one)
     rag_service: ResumeRAGService
-    session_id: str = None
+    session_id: str = ""
 
     def __init__(self, rag_service: ResumeRAGService | None = None, session_id: str | None = None, **kwargs):
         """
         Initialize the tool with RAG service.
         
         Args:
-            rag_service: Instance of ResumeRAGService (will be enforced)
-            session_id: Current session ID
+            rag_service: Instance of ResumeRAGService (defaults to the
+                shared service from get_rag_service)
+            session_id: Session whose resume the tool may read (required)
+            
+        Raises:
+            ValueError: If no session_id is given
         """
+        # The RAG service is shared by every session in the process, so a
+        # tool without a session would read whichever resume was loaded last
+        if not session_id:
+            raise ValueError("ResumeRetrievalTool requires a session_id")
+        
         super().__init__(**kwargs)
         # Always use the ResumeRAGService implementation. If the provided
-        # rag_service is not an instance of ResumeRAGService, replace it.
+        # rag_service is not an instance of ResumeRAGService, fall back to
+        # the shared instance rather than opening new store/embedding clients
         if not isinstance(rag_service, ResumeRAGService):
-            self.rag_service = ResumeRAGService()
+            self.rag_service = get_rag_service()
         else:
             self.rag_service = rag_service
 
-        # allow session_id to be optional
-        self.session_id = session_id or "default"
+        self.session_id = session_id
     
     def _run(self, query: str, num_results: int = 4) -> str:
         """
@@ -6,6 +6,7 @@ This module provides a LangChain-compatible wrapper for Google Gemini embeddings
 
 from typing import List
 
+import httpx
 from google import genai
 from google.genai import types
 from langchain_core.embeddings import Embeddings
@@ -15,6 +16,10 @@ import os
 
 load_dotenv()  # Load environment variables from .env file
 
+# Keep-alive pool for the embedding HTTP client; ingestion and retrieval run
+# on worker threads that all share one client, so connections (and their TLS
+# sessions) are reused instead of re-negotiated per request
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
 
 
 class GeminiEmbeddings(Embeddings):
@@ -28,7 +33,8 @@ class GeminiEmbeddings(Embeddings):
         self,
         model: str = "gemini-embedding-001",
         output_dimensionality: int = 768,
-        api_key: str = os.getenv("GOOGLE_API_KEY") # type: ignore
+        api_key: str = os.getenv("GOOGLE_API_KEY"), # type: ignore
+        batch_size: int = 100
     ):
         """
         Initialize Gemini embeddings.
@@ -37,15 +43,21 @@ class GeminiEmbeddings(Embeddings):
             model: Gemini embedding model name (default: gemini-embedding-001)
             output_dimensionality: Output dimension for embeddings (default: 768)
             api_key: Google API key (optional, will use GOOGLE_API_KEY env var)
+            batch_size: Maximum number of texts sent per embedding request
         """
         self.model = model
         self.output_dimensionality = output_dimensionality
+        self.batch_size = batch_size
         
             
+        http_options = types.HttpOptions(
+            client_args={"limits": HTTP_LIMITS},
+            async_client_args={"limits": HTTP_LIMITS},
+        )
         if api_key:
-            self.client = genai.Client(api_key=api_key)
+            self.client = genai.Client(api_key=api_key, http_options=http_options)
         else:
-            self.client = genai.Client()
+            self.client = genai.Client(http_options=http_options)
         
         self.config = types.EmbedContentConfig(
             output_dimensionality=output_dimensionality
@@ -55,6 +67,9 @@ class GeminiEmbeddings(Embeddings):
         """
         Embed a list of documents.
         
+        Texts are sent in batches of up to ``batch_size`` per request
+        instead of one request per text.
+        
         Args:
             texts: List of text documents to embed
             
@@ -63,23 +78,24 @@ class GeminiEmbeddings(Embeddings):
         """
         embeddings = []
         
-        for text in texts:
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
             result = self.client.models.embed_content(
                 model=self.model,
-                contents=text,
+                contents=batch, # type: ignore
                 config=self.config
             )
             
-            # Ensure the API returned embeddings
-            if not result or not getattr(result, "embeddings", None):
+            # Ensure the API returned one embedding per text
+            if not result or len(getattr(result, "embeddings", None) or []) != len(batch):
                 raise RuntimeError("Gemini API did not return embeddings for the provided text input.")
 
-            embedding_obj = result.embeddings[0] #type: ignore
-            values = getattr(embedding_obj, "values", None)
-            if not values:
-                raise RuntimeError("Gemini API returned an embedding object without 'values'.")
+            for embedding_obj in result.embeddings: #type: ignore
+                values = getattr(embedding_obj, "values", None)
+                if not values:
+                    raise RuntimeError("Gemini API returned an embedding object without 'values'.")
 
-            embeddings.append(list(values))
+                embeddings.append(list(values))
         
         return embeddings
     
@@ -5,6 +5,8 @@ Centralized configuration for the RAG system.
 Modify these settings to customize RAG behavior.
 """
 
+import os
+
 # ============================================================================
 # PDF Processing Configuration
 # ============================================================================
@@ -99,6 +101,10 @@ SESSION_CONFIG = {
     
     # Maximum number of sessions to keep (0 = unlimited)
     "max_sessions": 0,
+    
+    # Maximum number of session vector stores kept loaded in memory
+    # (least recently used ones are reloaded from disk on demand)
+    "max_loaded_sessions": 64,
 }
 
 # ============================================================================
@@ -109,6 +115,9 @@ PERFORMANCE_CONFIG = {
     # Enable caching of embeddings
     "cache_embeddings": True,
     
+    # Maximum number of query embeddings kept in memory (LRU)
+    "query_embedding_cache_size": 4096,
+    
     # Cache directory
     "cache_directory": "./.embedding_cache",
     
@@ -117,6 +126,10 @@ PERFORMANCE_CONFIG = {
     
     # Result cache TTL in seconds
     "cache_ttl": 3600,
+    
+    # Maximum number of resumes parsed/chunked/embedded at the same time
+    # (extra ingestions wait, so request bursts don't thrash the CPU)
+    "max_concurrent_ingestions": os.cpu_count() or 4,
 }
 
 # ============================================================================
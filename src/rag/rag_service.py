@@ -9,7 +9,10 @@ This module handles:
 """
 
 import hashlib
+import logging
+from collections import OrderedDict
 from pathlib import Path
+from threading import BoundedSemaphore, Lock
 from typing import List, Optional
 
 import pymupdf  # PyMuPDF for PDF processing
@@ -22,9 +25,16 @@ from rag.rag_config import (
     CHUNKING_CONFIG,
     EMBEDDING_CONFIG,
     VECTORSTORE_CONFIG,
-    RETRIEVAL_CONFIG
+    RETRIEVAL_CONFIG,
+    SESSION_CONFIG,
+    PERFORMANCE_CONFIG
 )
 
+logger = logging.getLogger(__name__)
+
+# Ingestion of one resume's content is serialized on one of this many locks
+CONTENT_LOCK_STRIPES = 64
+
 
 class ResumeRAGService:
     """
@@ -48,7 +58,8 @@ class ResumeRAGService:
         # Initialize Gemini embeddings
         self.embeddings = GeminiEmbeddings(
             model=EMBEDDING_CONFIG["model"],
-            output_dimensionality=EMBEDDING_CONFIG["output_dimensionality"]
+            output_dimensionality=EMBEDDING_CONFIG["output_dimensionality"],
+            batch_size=EMBEDDING_CONFIG["batch_size"]
         )
         
         # Initialize text splitter
@@ -59,7 +70,21 @@ class ResumeRAGService:
             separators=CHUNKING_CONFIG["separators"]
         )
         
-        # Vector store will be initialized per session
+        # Vector stores are kept per session so one service instance can be
+        # shared by concurrent interview flows without switching a single
+        # "current" store underneath them
+        self._session_stores: "OrderedDict[str, Chroma]" = OrderedDict()
+        self._session_collections: dict = {}
+        self._content_locks = [Lock() for _ in range(CONTENT_LOCK_STRIPES)]
+        self._stores_lock = Lock()
+        self._ingest_slots = BoundedSemaphore(PERFORMANCE_CONFIG["max_concurrent_ingestions"])
+        
+        # Query embeddings keyed by normalized query text; topics and job
+        # descriptions repeat across sessions for the same role
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_embeddings_lock = Lock()
+        
+        # Most recently ingested/loaded session (for callers without a session_id)
         self.vectorstore = None
         self.current_session_id = None
     
@@ -82,7 +107,13 @@ class ResumeRAGService:
         doc.close()
         return text
     
-    def process_resume(self, resume_content: str, session_id: str, metadata: Optional[dict] = None) -> int:
+    def process_resume(
+        self,
+        resume_content: str,
+        session_id: str,
+        metadata: Optional[dict] = None,
+        collection_name: Optional[str] = None
+    ) -> int:
         """
         Process resume text and create embeddings.
         
@@ -90,6 +121,8 @@ class ResumeRAGService:
             resume_content: The resume text content
             session_id: Unique session identifier
             metadata: Additional metadata to attach to chunks
+            collection_name: Collection to store the chunks in
+                             (defaults to one named after the session)
             
         Returns:
             Number of chunks created
@@ -104,7 +137,8 @@ class ResumeRAGService:
         metadata.update({
             "session_id": session_id,
             "source": "resume",
-            "total_chunks": len(chunks)
+            "total_chunks": len(chunks),
+            "text_length": len(resume_content)
         })
         
         # Create metadata for each chunk
@@ -114,9 +148,9 @@ class ResumeRAGService:
         ]
         
         # Create or update vector store for this session
-        collection_name = self._get_collection_name(session_id)
+        collection_name = collection_name or self._get_collection_name(session_id)
         
-        self.vectorstore = Chroma.from_texts(
+        vectorstore = Chroma.from_texts(
             texts=chunks,
             embedding=self.embeddings,
             metadatas=metadatas,
@@ -124,41 +158,90 @@ class ResumeRAGService:
             persist_directory=str(self.persist_directory)
         )
         
-        self.current_session_id = session_id
+        self._register_session_store(session_id, vectorstore, collection_name)
         
-        print(f"✅ Processed resume into {len(chunks)} chunks")
+        logger.info("✅ Processed resume into %d chunks", len(chunks))
         return len(chunks)
     
-    def ingest_pdf_resume(self, pdf_path: str, session_id: str, metadata: Optional[dict] = None) -> dict:
+    def ingest_pdf_resume(
+        self,
+        pdf_path: str,
+        session_id: str,
+        metadata: Optional[dict] = None,
+        file_hash: Optional[str] = None
+    ) -> dict:
         """
         Complete pipeline: Extract text from PDF and process into RAG.
         
+        Chunks are stored in a collection keyed by the PDF's content hash,
+        so an identical resume uploaded again is attached to the existing
+        collection instead of being parsed and embedded a second time.
+        
         Args:
             pdf_path: Path to the PDF resume file
             session_id: Unique session identifier
             metadata: Additional metadata
+            file_hash: SHA256 of the PDF, if already known (skips re-reading
+                the file to hash it)
             
         Returns:
-            Dictionary with processing results
+            Dictionary with processing results (text_length is read back
+            from the stored chunks when existing embeddings were reused)
         """
-        # Extract text from PDF
-        print(f"📄 Extracting text from PDF: {pdf_path}")
-        resume_text = self.extract_text_from_pdf(pdf_path)
-        
-        # Process the text
-        num_chunks = self.process_resume(resume_text, session_id, metadata)
-        
-        # Calculate file hash for tracking
-        file_hash = self._calculate_file_hash(pdf_path)
+        file_hash = file_hash or self.calculate_file_hash(pdf_path)
+        collection_name = self._get_content_collection_name(file_hash)
+        text_length = None
+        reused = False
+        
+        # Serialize ingestion of the same content so concurrent uploads of
+        # one resume don't embed it twice
+        with self._content_lock(collection_name):
+            vectorstore = self._open_collection(collection_name)
+            num_chunks = vectorstore._collection.count()  # type: ignore
+            
+            if num_chunks:
+                logger.info("♻️  Reusing embeddings for identical resume: %s", pdf_path)
+                reused = True
+                text_length = self._stored_text_length(vectorstore)
+                self._register_session_store(session_id, vectorstore, collection_name)
+            else:
+                # Parsing, chunking and embedding are the CPU-heavy part;
+                # cap how many run at once across concurrent requests
+                with self._ingest_slots:
+                    # Extract text from PDF
+                    logger.info("📄 Extracting text from PDF: %s", pdf_path)
+                    resume_text = self.extract_text_from_pdf(pdf_path)
+                    
+                    # Process the text
+                    num_chunks = self.process_resume(
+                        resume_text, session_id, metadata, collection_name=collection_name
+                    )
+                    text_length = len(resume_text)
         
         return {
             "session_id": session_id,
             "pdf_path": pdf_path,
             "file_hash": file_hash,
             "num_chunks": num_chunks,
-            "text_length": len(resume_text)
+            "text_length": text_length,
+            "reused": reused
         }
     
+    def _stored_text_length(self, vectorstore: Chroma) -> Optional[int]:
+        """
+        Read the resume's text length from a stored chunk's metadata.
+        
+        Args:
+            vectorstore: Vector store backed by an ingested resume collection
+            
+        Returns:
+            The original text length, or None for collections ingested
+            before it was recorded
+        """
+        stored = vectorstore._collection.get(limit=1, include=["metadatas"])  # type: ignore
+        metadatas = stored.get("metadatas") or [{}]
+        return (metadatas[0] or {}).get("text_length")
+    
     def retrieve_context(self, query: str, k: Optional[int] = None, session_id: Optional[str] = None) -> List[str]:
         """
         Retrieve relevant resume chunks based on a query.
@@ -174,36 +257,180 @@ class ResumeRAGService:
         # Set default if k is None/0 and enforce maximum
         k = min(k or RETRIEVAL_CONFIG["default_k"], RETRIEVAL_CONFIG["max_k"])
 
-        if session_id and session_id != self.current_session_id:
-            self._load_session(session_id)
-        
-        if not self.vectorstore:
-            raise ValueError("No vector store loaded. Please ingest a resume first.")
+        vectorstore = self._get_vectorstore(session_id)
         
         # Perform similarity search
-        results = self.vectorstore.similarity_search(query, k=k)
+        results = vectorstore.similarity_search_by_vector(self.embed_queries([query])[0], k=k)
         
         # Extract text from results
         contexts = [doc.page_content for doc in results]
         
         return contexts
+
+    def retrieve_contexts_batch(self, queries: List[str], k: Optional[int] = None, session_id: Optional[str] = None) -> List[List[str]]:
+        """
+        Retrieve relevant resume chunks for several queries at once.
+
+        Uncached queries go through one embed_documents() call and all of
+        them are searched with one multi-vector query, instead of one
+        embedding + search per query.
+
+        Args:
+            queries: The queries/questions to search for
+            k: Number of chunks to retrieve per query (defaults to config value)
+            session_id: Session ID to retrieve from (uses current if None)
+
+        Returns:
+            List of relevant text chunks for each query, in query order
+        """
+        if not queries:
+            return []
+
+        # Set default if k is None/0 and enforce maximum
+        k = min(k or RETRIEVAL_CONFIG["default_k"], RETRIEVAL_CONFIG["max_k"])
+
+        vectorstore = self._get_vectorstore(session_id)
+
+        query_embeddings = self.embed_queries(queries)
+
+        results = vectorstore._collection.query(  # type: ignore
+            query_embeddings=query_embeddings,
+            n_results=k,
+            include=["documents"]
+        )
+
+        return [list(documents) for documents in results["documents"]]
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed search queries, reusing cached embeddings where possible.
+        
+        Queries are normalized (lowercased, whitespace collapsed) before
+        lookup and embedding, and only cache misses are sent to the model.
         
-    def _load_session(self, session_id: str):
+        Args:
+            queries: Query texts
+            
+        Returns:
+            One embedding per query, in query order
+        """
+        keys = [" ".join(query.split()).lower() for query in queries]
+        
+        if not PERFORMANCE_CONFIG["cache_embeddings"]:
+            return self.embeddings.embed_documents(keys)
+        
+        with self._query_embeddings_lock:
+            cached = {key: self._query_embeddings[key] for key in keys if key in self._query_embeddings}
+            for key in cached:
+                self._query_embeddings.move_to_end(key)
+        
+        misses = list(dict.fromkeys(key for key in keys if key not in cached))
+        if misses:
+            embedded = dict(zip(misses, self.embeddings.embed_documents(misses)))
+            cached.update(embedded)
+            
+            with self._query_embeddings_lock:
+                self._query_embeddings.update(embedded)
+                while len(self._query_embeddings) > PERFORMANCE_CONFIG["query_embedding_cache_size"]:
+                    self._query_embeddings.popitem(last=False)
+        
+        return [cached[key] for key in keys]
+    
+    def _get_vectorstore(self, session_id: Optional[str] = None) -> Chroma:
+        """
+        Get the vector store for a session, loading it if needed.
+        
+        Args:
+            session_id: Session ID to look up (uses current if None)
+            
+        Returns:
+            The session's vector store
+            
+        Raises:
+            ValueError: If no session_id is given and nothing has been loaded
+        """
+        if not session_id:
+            if not self.vectorstore:
+                raise ValueError("No vector store loaded. Please ingest a resume first.")
+            return self.vectorstore
+        
+        with self._stores_lock:
+            vectorstore = self._session_stores.get(session_id)
+            if vectorstore is not None:
+                self._session_stores.move_to_end(session_id)
+                return vectorstore
+        
+        return self._load_session(session_id)
+    
+    def _register_session_store(self, session_id: str, vectorstore: Chroma, collection_name: str):
+        """
+        Keep a session's vector store loaded, evicting the least recently
+        used one beyond the configured limit.
+        
+        Args:
+            session_id: Session ID the store belongs to
+            vectorstore: The session's vector store
+            collection_name: Name of the collection backing the store
+        """
+        with self._stores_lock:
+            self._session_collections[session_id] = collection_name
+            self._session_stores[session_id] = vectorstore
+            self._session_stores.move_to_end(session_id)
+            while len(self._session_stores) > SESSION_CONFIG["max_loaded_sessions"]:
+                self._session_stores.popitem(last=False)
+            
+            self.vectorstore = vectorstore
+            self.current_session_id = session_id
+    
+    def _load_session(self, session_id: str) -> Chroma:
         """
         Load a specific session's vector store.
         
         Args:
             session_id: Session ID to load
+            
+        Returns:
+            The session's vector store
+        """
+        with self._stores_lock:
+            collection_name = self._session_collections.get(session_id)
+        collection_name = collection_name or self._get_collection_name(session_id)
+        
+        vectorstore = self._open_collection(collection_name)
+        
+        self._register_session_store(session_id, vectorstore, collection_name)
+        return vectorstore
+    
+    def _open_collection(self, collection_name: str) -> Chroma:
         """
-        collection_name = self._get_collection_name(session_id)
+        Open (or create) a persisted collection.
         
-        self.vectorstore = Chroma(
+        Args:
+            collection_name: Name of the collection
+            
+        Returns:
+            Vector store backed by the collection
+        """
+        return Chroma(
             collection_name=collection_name,
             embedding_function=self.embeddings,
             persist_directory=str(self.persist_directory)
         )
+    
+    def _content_lock(self, collection_name: str) -> Lock:
+        """
+        Get the lock guarding one resume collection's content.
         
-        self.current_session_id = session_id
+        Locks are striped over a fixed pool, so memory stays constant no
+        matter how many distinct resumes are ingested.
+        
+        Args:
+            collection_name: Name of the content-keyed collection
+            
+        Returns:
+            Lock for that collection
+        """
+        return self._content_locks[hash(collection_name) % CONTENT_LOCK_STRIPES]
     
     def _get_collection_name(self, session_id: str) -> str:
         """
@@ -218,7 +445,20 @@ class ResumeRAGService:
         # Create a valid collection name (alphanumeric + underscores)
         return f"resume_{session_id.replace('-', '_')}"
     
-    def _calculate_file_hash(self, file_path: str) -> str:
+    def _get_content_collection_name(self, file_hash: str) -> str:
+        """
+        Generate a collection name from a resume's content hash.
+        
+        Args:
+            file_hash: SHA256 hex digest of the resume file
+            
+        Returns:
+            Collection name
+        """
+        # 128 bits of the digest keeps the name well within Chroma's limits
+        return f"{VECTORSTORE_CONFIG['collection_prefix']}_{file_hash[:32]}"
+    
+    def calculate_file_hash(self, file_path: str) -> str:
         """
         Calculate SHA256 hash of a file.
         
@@ -236,19 +476,85 @@ class ResumeRAGService:
         
         return sha256_hash.hexdigest()
     
+    def warm_up(self):
+        """
+        Issue one small embedding request ahead of real traffic.
+        
+        Opens the embeddings client's pooled HTTPS connection (TLS
+        handshake included) so the first resume or query doesn't pay for it.
+        """
+        self.embeddings.embed_query("warm-up")
+    
+    def release_session(self, session_id: str):
+        """
+        Detach a session from its vector store without deleting the data.
+        
+        The underlying collection may be shared with other sessions that
+        ingested the same resume, so it is kept for reuse.
+        
+        Args:
+            session_id: Session ID to release
+        """
+        with self._stores_lock:
+            self._session_stores.pop(session_id, None)
+            self._session_collections.pop(session_id, None)
+    
     def clear_session(self, session_id: str):
         """
         Clear/delete a session's data from the vector store.
         
+        Content-keyed collections are shared by every session that ingested
+        the same resume, so the collection is only deleted once no other
+        session is attached to it; otherwise the session is just detached.
+        
         Args:
             session_id: Session ID to clear
         """
-        collection_name = self._get_collection_name(session_id)
-        
-        # Delete the collection
-        try:
-            client = self.vectorstore._client if self.vectorstore else Chroma._client # type: ignore
-            client.delete_collection(collection_name)
-            print(f"✅ Cleared session: {session_id}")
-        except Exception as e:
-            print(f"⚠️  Could not clear session {session_id}: {e}")
+        with self._stores_lock:
+            collection_name = (
+                self._session_collections.pop(session_id, None)
+                or self._get_collection_name(session_id)
+            )
+            vectorstore = self._session_stores.pop(session_id, None) or self.vectorstore
+        
+        # Ingestion attaches sessions under the same lock, so no session can
+        # pick the collection up between the check and the delete
+        with self._content_lock(collection_name):
+            with self._stores_lock:
+                in_use = collection_name in self._session_collections.values()
+            
+            if in_use:
+                logger.info("✅ Detached session %s; collection still in use", session_id)
+                return
+            
+            # Delete the collection
+            try:
+                client = vectorstore._client if vectorstore else Chroma._client # type: ignore
+                client.delete_collection(collection_name)
+                logger.info("✅ Cleared session: %s", session_id)
+            except Exception as e:
+                logger.warning("⚠️  Could not clear session %s: %s", session_id, e)
+
+
+_rag_service: Optional[ResumeRAGService] = None
+_rag_service_lock = Lock()
+
+
+def get_rag_service() -> ResumeRAGService:
+    """
+    Get the process-wide RAG service, creating it on first use.
+    
+    Sharing one instance avoids building a new embeddings client and
+    text splitter for every interview flow.
+    
+    Returns:
+        The shared ResumeRAGService instance
+    """
+    global _rag_service
+    
+    if _rag_service is None:
+        with _rag_service_lock:
+            if _rag_service is None:
+                _rag_service = ResumeRAGService()
+    
+    return _rag_service
@@ -27,7 +27,10 @@ def test_rag_ingestion(pdf_path: str):
     )
     
     print(f"\n   Results:")
-    print(f"   - Text length: {result['text_length']} characters")
+    if result['text_length'] is not None:
+        print(f"   - Text length: {result['text_length']} characters")
+    else:
+        print("   - Text length: unknown (reused existing embeddings)")
     print(f"   - Number of chunks: {result['num_chunks']}")
     print(f"   - File hash: {result['file_hash'][:16]}...")
     
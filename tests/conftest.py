@@ -0,0 +1,207 @@
+"""
+Shared fixtures for the Interview Coach test suite.
+
+Services are built without the lifespan and run against fakes: evaluation
+crew runs, question flows and the RAG service used by InterviewService are
+replaced, so no LLM or embedding calls are made. The ``rag_service``
+fixture runs the real ResumeRAGService on a temporary Chroma directory
+with a deterministic embedder.
+"""
+
+import asyncio
+import hashlib
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+
+class FakeCrewRun:
+    """Stand-in for ``EvaluationService._run_crew`` that records each call."""
+
+    def __init__(self, report: str = "## Summary\nSolid interview."):
+        self.report = report
+        self.calls: List[Tuple[str, str]] = []
+        # Cleared to hold runs in flight until the test releases them
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, job_description: str, transcript_text: str) -> str:
+        self.calls.append((job_description, transcript_text))
+        await self.release.wait()
+        return self.report
+
+
+@pytest.fixture
+def fake_crew_run() -> FakeCrewRun:
+    return FakeCrewRun()
+
+
+@pytest.fixture
+def evaluation_service(monkeypatch, fake_crew_run):
+    """EvaluationService whose crew runs are handled by ``fake_crew_run``."""
+    from interview_coach.api.evaluation_service import EvaluationService
+
+    service = EvaluationService()
+    monkeypatch.setattr(service, "_run_crew", fake_crew_run)
+    return service
+
+
+class FakeRAGService:
+    """Stand-in for the shared ResumeRAGService used by InterviewService."""
+
+    def __init__(self):
+        self.embedded: List[str] = []
+        self.released: List[str] = []
+        # Every job description embeds to the same vector unless overridden
+        self.embedding = [1.0, 0.0]
+
+    def calculate_file_hash(self, file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        self.embedded.extend(queries)
+        return [list(self.embedding) for _ in queries]
+
+    def release_session(self, session_id: str) -> None:
+        self.released.append(session_id)
+
+    def warm_up(self) -> None:
+        pass
+
+
+class FakeFlowScript:
+    """
+    Drives the fake question flows.
+
+    Each run publishes the first question, waits for ``release``, then
+    publishes the rest (or raises ``error``).
+    """
+
+    def __init__(self):
+        self.questions = ["Tell me about yourself.", "Why this role?", "Describe a hard bug."]
+        self.error: Optional[Exception] = None
+        self.release = asyncio.Event()
+        self.release.set()
+        self.flows: List["FakeFlow"] = []
+
+    @property
+    def runs(self) -> int:
+        return sum(flow.started for flow in self.flows)
+
+
+class FakeFlow:
+    """Stand-in for GenerateInterviewQuestionsFlow."""
+
+    def __init__(self, script: FakeFlowScript, rag_service=None):
+        self.script = script
+        self.question_stream: asyncio.Queue = asyncio.Queue()
+        self.state = SimpleNamespace(session_id="", questions=[], interview_topics=[])
+        self.started = False
+        self.finished = False
+        self.payload: Dict[str, Any] = {}
+
+    async def kickoff_async(self, payload: Dict[str, Any]) -> None:
+        self.started = True
+        self.payload = payload
+        self.state.session_id = f"session_fake_{len(self.script.flows)}"
+        questions = list(self.script.questions)
+        self.state.interview_topics = [f"topic {i}" for i in range(len(questions))]
+
+        for index, question in enumerate(questions):
+            if index == 1:
+                await self.script.release.wait()
+                if self.script.error is not None:
+                    raise self.script.error
+            self.question_stream.put_nowait((index, question))
+
+        self.state.questions = questions
+        self.finished = True
+
+
+@pytest.fixture
+def fake_rag() -> FakeRAGService:
+    return FakeRAGService()
+
+
+@pytest.fixture
+def flow_script() -> FakeFlowScript:
+    return FakeFlowScript()
+
+
+@pytest.fixture
+def interview_service(monkeypatch, fake_rag, flow_script):
+    """InterviewService running fake flows against a fake RAG service."""
+    from interview_coach.api import interview_service as module
+
+    def make_flow(rag_service=None):
+        flow = FakeFlow(flow_script, rag_service)
+        flow_script.flows.append(flow)
+        return flow
+
+    monkeypatch.setattr(module, "get_rag_service", lambda: fake_rag)
+    monkeypatch.setattr(module, "GenerateInterviewQuestionsFlow", make_flow)
+    return module.InterviewService()
+
+
+class FakeEmbeddings:
+    """Deterministic embedder standing in for GeminiEmbeddings."""
+
+    def __init__(self, **kwargs):
+        self.calls = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text)
+
+    @staticmethod
+    def _vector(text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [b / 255 for b in digest[:8]]
+
+
+@pytest.fixture
+def rag_service(monkeypatch, tmp_path):
+    """ResumeRAGService on a temporary Chroma directory with a fake embedder."""
+    from rag import rag_service as module
+
+    monkeypatch.setattr(module, "GeminiEmbeddings", FakeEmbeddings)
+    return module.ResumeRAGService(persist_directory=str(tmp_path / "chroma"))
+
+
+@pytest.fixture
+def app(evaluation_service, interview_service):
+    """API app with the router and the stubbed services on app.state."""
+    from fastapi import FastAPI
+
+    from interview_coach.api.routes import router
+
+    app = FastAPI()
+    app.include_router(router)
+    app.state.evaluation_service = evaluation_service
+    app.state.interview_service = interview_service
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def upload_dir(monkeypatch, tmp_path):
+    """Point resume uploads at a temporary directory."""
+    from interview_coach.api import routes
+
+    upload_dir = tmp_path / "resumes"
+    monkeypatch.setattr(routes, "RESUME_UPLOAD_DIR", upload_dir)
+    monkeypatch.setattr(routes, "_upload_dir_ready", False)
+    return upload_dir
@@ -0,0 +1,181 @@
+"""Tests for the in-process caches."""
+
+from interview_coach import cache
+from interview_coach.cache import SemanticCache, TTLCache, content_key, normalize_text
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _use_clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+# ============================================================================
+# Keys
+# ============================================================================
+
+def test_normalize_text_collapses_case_and_whitespace():
+    assert normalize_text("  Senior\n Python\tDeveloper ") == "senior python developer"
+
+
+def test_content_key_separates_parts():
+    assert content_key("ab", "c") != content_key("a", "bc")
+    assert content_key("a", "b") == content_key("a", "b")
+
+
+# ============================================================================
+# TTLCache
+# ============================================================================
+
+def test_ttl_cache_evicts_least_recently_used():
+    lru = TTLCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1  # "b" is now the least recently used
+
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    lru = TTLCache(maxsize=4, ttl=10)
+    lru.set("a", 1)
+
+    clock.now += 10
+    assert lru.get("a") == 1
+
+    clock.now += 1
+    assert lru.get("a", "missing") == "missing"
+    assert len(lru) == 0
+
+
+def test_ttl_cache_items_skips_expired(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    lru = TTLCache(maxsize=4, ttl=10)
+    lru.set("old", 1)
+    clock.now += 6
+    lru.set("new", 2)
+    clock.now += 6
+
+    assert lru.items() == [("new", 2)]
+
+
+def test_ttl_cache_pop_and_clear():
+    lru = TTLCache()
+    lru.set("a", 1)
+    lru.set("b", 2)
+
+    assert lru.pop("a") == 1
+    assert lru.pop("a", "gone") == "gone"
+
+    lru.clear()
+    assert len(lru) == 0
+
+
+# ============================================================================
+# SemanticCache
+# ============================================================================
+
+def test_semantic_cache_exact_get():
+    sem = SemanticCache()
+    sem.set("key", "value", namespace="resume-1", embedding=[1.0, 0.0])
+
+    assert sem.get("key") == "value"
+    assert sem.get("other", "default") == "default"
+
+
+def test_semantic_cache_search_respects_threshold():
+    sem = SemanticCache(threshold=0.9)
+    sem.set("python", "python questions", namespace="r", embedding=[1.0, 0.0])
+
+    # Same direction, different magnitude: cosine similarity 1.0
+    assert sem.search("r", [5.0, 0.0]) == "python questions"
+    # cos(45°) ≈ 0.71 is below the threshold
+    assert sem.search("r", [1.0, 1.0], "miss") == "miss"
+
+
+def test_semantic_cache_search_returns_closest_entry():
+    sem = SemanticCache(threshold=0.5)
+    sem.set("a", "first", namespace="r", embedding=[1.0, 0.2])
+    sem.set("b", "second", namespace="r", embedding=[1.0, 0.0])
+
+    assert sem.search("r", [1.0, 0.0]) == "second"
+
+
+def test_semantic_cache_search_is_scoped_to_namespace():
+    sem = SemanticCache(threshold=0.9)
+    sem.set("key", "value", namespace="resume-1", embedding=[1.0, 0.0])
+
+    assert sem.search("resume-2", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_has_namespace_needs_an_embedding():
+    sem = SemanticCache()
+    sem.set("plain", "value", namespace="resume-1")
+    assert not sem.has_namespace("resume-1")
+    assert sem.search("resume-1", [1.0, 0.0]) is None
+
+    sem.set("embedded", "value", namespace="resume-1", embedding=[0.0, 1.0])
+    assert sem.has_namespace("resume-1")
+    assert not sem.has_namespace("resume-2")
+
+
+def test_semantic_cache_expired_entries_do_not_match(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    sem = SemanticCache(threshold=0.9, ttl=10)
+    sem.set("key", "value", namespace="r", embedding=[1.0, 0.0])
+
+    clock.now += 11
+
+    assert sem.search("r", [1.0, 0.0]) is None
+    assert not sem.has_namespace("r")
+
+
+def test_semantic_cache_attach_embedding_keeps_age_and_position(monkeypatch):
+    clock = _use_clock(monkeypatch)
+    sem = SemanticCache(threshold=0.9, maxsize=2, ttl=10)
+    value = ["question"]
+    sem.set("a", value, namespace="r")
+    sem.set("b", "other", namespace="r")
+
+    clock.now += 6
+    assert sem.attach_embedding("a", value, [1.0, 0.0])
+    assert sem.has_namespace("r")
+
+    # Still the least recently stored entry: evicted first...
+    sem.set("c", "newest", namespace="r")
+    assert sem.get("a") is None
+
+    # ...and its original expiry is unchanged
+    sem.set("d", value, namespace="r")
+    clock.now += 6
+    assert sem.attach_embedding("d", value, [1.0, 0.0])
+    clock.now += 5
+    assert sem.get("d") is None
+
+
+def test_semantic_cache_attach_embedding_skips_replaced_or_evicted_entries():
+    sem = SemanticCache(threshold=0.9, maxsize=1)
+    stale = ["old questions"]
+    sem.set("a", stale, namespace="r")
+    sem.set("a", ["new questions"], namespace="r")
+
+    assert not sem.attach_embedding("a", stale, [1.0, 0.0])
+    assert not sem.has_namespace("r")
+
+    sem.set("b", "other", namespace="r")
+    assert not sem.attach_embedding("a", stale, [1.0, 0.0])
+    assert sem.get("a") is None
@@ -0,0 +1,123 @@
+"""Tests for EvaluationService request handling and run coalescing."""
+
+import asyncio
+
+import pytest
+
+from interview_coach.api.evaluation_service import QuestionAnswerPair
+
+JOB_DESCRIPTION = "Senior Python Developer building FastAPI services and LLM pipelines."
+TRANSCRIPT = [
+    QuestionAnswerPair("Tell me about a service you built.", "A FastAPI gateway for ML models."),
+    QuestionAnswerPair("How do you test async code?", "With pytest and an event loop fixture."),
+]
+
+
+async def test_identical_concurrent_evaluations_share_one_crew_run(
+    evaluation_service, fake_crew_run
+):
+    fake_crew_run.release.clear()
+
+    runs = [
+        asyncio.create_task(evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    fake_crew_run.release.set()
+    results = await asyncio.gather(*runs)
+
+    assert len(fake_crew_run.calls) == 1
+    assert {r.evaluation_report for r in results} == {fake_crew_run.report}
+    assert not evaluation_service._inflight
+
+
+async def test_repeat_evaluation_uses_cached_report(evaluation_service, fake_crew_run):
+    await evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT)
+    result = await evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT, "Ada")
+
+    assert len(fake_crew_run.calls) == 1
+    assert result.evaluation_report == fake_crew_run.report
+    assert result.candidate_name == "Ada"
+
+
+async def test_different_transcripts_run_separately(evaluation_service, fake_crew_run):
+    await evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT)
+    await evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT[:1])
+
+    assert len(fake_crew_run.calls) == 2
+
+
+async def test_failed_run_is_not_cached(evaluation_service, monkeypatch):
+    calls = []
+
+    async def failing_run(job_description, transcript_text):
+        calls.append(transcript_text)
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(evaluation_service, "_run_crew", failing_run)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="provider unavailable"):
+            await evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT)
+
+    assert len(calls) == 2
+    assert len(evaluation_service._reports) == 0
+
+
+async def test_cancelled_caller_does_not_cancel_shared_run(
+    evaluation_service, fake_crew_run
+):
+    fake_crew_run.release.clear()
+
+    first = asyncio.create_task(evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT))
+    second = asyncio.create_task(evaluation_service.evaluate(JOB_DESCRIPTION, TRANSCRIPT))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    fake_crew_run.release.set()
+    result = await second
+
+    assert first.cancelled()
+    assert result.evaluation_report == fake_crew_run.report
+    assert len(fake_crew_run.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "job_description, transcript",
+    [
+        ("Too short", TRANSCRIPT),
+        (JOB_DESCRIPTION, []),
+    ],
+)
+async def test_invalid_requests_are_rejected(
+    evaluation_service, fake_crew_run, job_description, transcript
+):
+    with pytest.raises(ValueError):
+        await evaluation_service.evaluate(job_description, transcript)
+
+    assert not fake_crew_run.calls
+
+
+async def test_evaluate_stream_yields_report_sections(evaluation_service, fake_crew_run):
+    fake_crew_run.report = "## Summary\nGood.\n## Strengths\nClear answers."
+
+    events = [
+        event async for event in evaluation_service.evaluate_stream(JOB_DESCRIPTION, TRANSCRIPT)
+    ]
+
+    assert [name for name, _ in events] == ["started", "section", "section", "done"]
+    assert events[0][1]["questions_evaluated"] == len(TRANSCRIPT)
+
+
+async def test_evaluate_endpoint_uses_app_state_service(client, fake_crew_run):
+    response = await client.post("/api/v1/evaluate", json={
+        "job_description": JOB_DESCRIPTION,
+        "transcript": [{"question": qa.question, "answer": qa.answer} for qa in TRANSCRIPT],
+        "candidate_name": "Ada",
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["evaluation_report"] == fake_crew_run.report
+    assert body["questions_evaluated"] == len(TRANSCRIPT)
+    assert len(fake_crew_run.calls) == 1
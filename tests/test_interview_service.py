@@ -0,0 +1,228 @@
+"""Tests for InterviewService question caching and streaming."""
+
+import asyncio
+
+import pytest
+
+JOB_DESCRIPTION = (
+    "Senior Python Developer\n"
+    "Build FastAPI services and LLM pipelines for our interview platform."
+)
+PARAPHRASED_JOB_DESCRIPTION = (
+    "Senior Python Developer\n"
+    "You will build LLM pipelines and FastAPI services for an interview product."
+)
+OTHER_ROLE = (
+    "Staff Data Engineer\n"
+    "Build FastAPI services and LLM pipelines for our interview platform."
+)
+
+
+@pytest.fixture
+def resume(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF-1.7 resume one")
+    return str(path)
+
+
+async def _drain_background(service):
+    while service._background_tasks:
+        await asyncio.gather(*service._background_tasks, return_exceptions=True)
+
+
+# ============================================================================
+# Question cache (_lookup_cached / _cache_result)
+# ============================================================================
+
+async def test_identical_request_is_served_from_cache(interview_service, flow_script):
+    first = await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    second = await interview_service.generate_questions(
+        "Grace", "  " + JOB_DESCRIPTION.upper().replace(" ", "\n ")
+    )
+
+    assert flow_script.runs == 1
+    assert second.questions == first.questions
+    assert second.candidate_name == "Grace"
+    assert second.session_id != first.session_id
+
+
+async def test_cached_copies_are_independent(interview_service):
+    first = await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    first.questions.append("mutated")
+
+    second = await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+
+    assert "mutated" not in second.questions
+
+
+async def test_paraphrased_job_description_hits_for_same_resume_and_role(
+    interview_service, flow_script, fake_rag, resume
+):
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION, resume)
+    await _drain_background(interview_service)
+
+    result = await interview_service.generate_questions("Ada", PARAPHRASED_JOB_DESCRIPTION, resume)
+
+    assert flow_script.runs == 1
+    assert result.questions == flow_script.questions
+    # The stored entry was embedded in the background, the paraphrase on lookup
+    assert len(fake_rag.embedded) == 2
+
+
+async def test_semantic_match_is_scoped_to_resume_and_role(
+    interview_service, flow_script, fake_rag, resume, tmp_path
+):
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION, resume)
+    await _drain_background(interview_service)
+
+    other_resume = tmp_path / "other.pdf"
+    other_resume.write_bytes(b"%PDF-1.7 resume two")
+    await interview_service.generate_questions("Ada", PARAPHRASED_JOB_DESCRIPTION, str(other_resume))
+    await interview_service.generate_questions("Ada", OTHER_ROLE, resume)
+
+    assert flow_script.runs == 3
+
+
+async def test_dissimilar_embedding_misses(interview_service, flow_script, fake_rag, resume):
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION, resume)
+    await _drain_background(interview_service)
+
+    fake_rag.embedding = [0.0, 1.0]
+    await interview_service.generate_questions("Ada", PARAPHRASED_JOB_DESCRIPTION, resume)
+
+    assert flow_script.runs == 2
+
+
+async def test_requests_without_resume_skip_embedding(interview_service, fake_rag):
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    await interview_service.generate_questions("Ada", PARAPHRASED_JOB_DESCRIPTION)
+    await _drain_background(interview_service)
+
+    assert fake_rag.embedded == []
+
+
+async def test_empty_question_sets_are_not_cached(interview_service, flow_script):
+    flow_script.questions = []
+
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+
+    assert flow_script.runs == 2
+
+
+async def test_rag_session_is_released_after_resume_run(interview_service, fake_rag, resume):
+    result = await interview_service.generate_questions("Ada", JOB_DESCRIPTION, resume)
+
+    assert fake_rag.released == [result.session_id]
+
+
+async def test_invalid_requests_are_rejected(interview_service, flow_script, tmp_path):
+    with pytest.raises(ValueError):
+        await interview_service.generate_questions("Ada", "Too short")
+    with pytest.raises(ValueError):
+        await interview_service.generate_questions(
+            "Ada", JOB_DESCRIPTION, str(tmp_path / "missing.pdf")
+        )
+
+    assert flow_script.runs == 0
+
+
+# ============================================================================
+# Streaming (stream_questions)
+# ============================================================================
+
+async def test_stream_yields_questions_and_caches_them(interview_service, flow_script):
+    streamed = [item async for item in interview_service.stream_questions("Ada", JOB_DESCRIPTION)]
+
+    assert streamed == list(enumerate(flow_script.questions))
+
+    result = await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    assert flow_script.runs == 1
+    assert result.questions == flow_script.questions
+
+
+async def test_stream_uses_batch_cache(interview_service, flow_script):
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+
+    streamed = [item async for item in interview_service.stream_questions("Ada", JOB_DESCRIPTION)]
+
+    assert flow_script.runs == 1
+    assert streamed == list(enumerate(flow_script.questions))
+
+
+async def test_stream_yields_first_question_before_flow_finishes(interview_service, flow_script):
+    flow_script.release.clear()
+    stream = interview_service.stream_questions("Ada", JOB_DESCRIPTION)
+
+    first = await asyncio.wait_for(anext(stream), timeout=1)
+
+    assert first == (0, flow_script.questions[0])
+    assert not flow_script.flows[0].finished
+
+    flow_script.release.set()
+    rest = [item async for item in stream]
+    assert [index for index, _ in rest] == [1, 2]
+
+
+async def test_stream_failure_raises_runtime_error(interview_service, flow_script):
+    flow_script.error = ValueError("crew exploded")
+    stream = interview_service.stream_questions("Ada", JOB_DESCRIPTION)
+
+    assert await anext(stream) == (0, flow_script.questions[0])
+    with pytest.raises(RuntimeError, match="crew exploded"):
+        await anext(stream)
+
+    # Nothing was cached from the failed run
+    flow_script.error = None
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION)
+    assert flow_script.runs == 2
+
+
+async def test_abandoned_stream_keeps_flow_slot_until_flow_finishes(
+    interview_service, flow_script, fake_rag, resume
+):
+    interview_service._flow_slots = asyncio.Semaphore(1)
+    flow_script.release.clear()
+
+    stream = interview_service.stream_questions("Ada", JOB_DESCRIPTION, resume)
+    await anext(stream)
+    await stream.aclose()  # client disconnected
+    await asyncio.sleep(0)
+
+    flow = flow_script.flows[0]
+    assert not flow.finished
+    assert interview_service._flow_slots.locked()
+    assert fake_rag.released == []
+
+    flow_script.release.set()
+    await _drain_background(interview_service)
+
+    assert flow.finished
+    assert not interview_service._flow_slots.locked()
+    assert fake_rag.released == [flow.state.session_id]
+
+    # The finished run is cached for the next request
+    await interview_service.generate_questions("Ada", JOB_DESCRIPTION, resume)
+    assert flow_script.runs == 1
+
+
+async def test_cancelled_stream_leaves_no_pending_queue_reads(interview_service, flow_script):
+    flow_script.release.clear()
+    stream = interview_service.stream_questions("Ada", JOB_DESCRIPTION)
+    await anext(stream)
+
+    consumer = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    await asyncio.sleep(0)
+
+    pending = [
+        task for task in asyncio.all_tasks()
+        if "Queue.get" in repr(task.get_coro()) and not task.done()
+    ]
+    assert pending == []
+
+    flow_script.release.set()
+    await _drain_background(interview_service)
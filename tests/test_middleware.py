@@ -0,0 +1,107 @@
+"""Tests for AllowAllCORSMiddleware."""
+
+from typing import Dict, List, Optional
+
+from interview_coach.api.middleware import AllowAllCORSMiddleware
+
+
+async def _call(method: str = "GET",
+                headers: Optional[Dict[str, str]] = None,
+                app_headers: Optional[List[tuple]] = None):
+    """Run one request through the middleware; return (status, headers, body, app_called)."""
+    app_called = False
+
+    async def app(scope, receive, send):
+        nonlocal app_called
+        app_called = True
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": list(app_headers or [(b"content-type", b"application/json")]),
+        })
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/api/v1/evaluate",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await AllowAllCORSMiddleware(app)(scope, receive, send)
+
+    start, body = messages
+    response_headers: Dict[bytes, bytes] = {}
+    for name, value in start["headers"]:
+        assert name not in response_headers, f"duplicate header {name!r}"
+        response_headers[name] = value
+    return start["status"], response_headers, body["body"], app_called
+
+
+async def test_request_without_origin_is_untouched():
+    status, headers, _, app_called = await _call()
+
+    assert app_called
+    assert b"access-control-allow-origin" not in headers
+
+
+async def test_simple_request_allows_any_origin_without_credentials():
+    _, headers, _, _ = await _call(headers={"Origin": "https://evil.example"})
+
+    assert headers[b"access-control-allow-origin"] == b"*"
+    assert b"access-control-allow-credentials" not in headers
+
+
+async def test_cookie_request_echoes_origin_with_credentials():
+    _, headers, _, _ = await _call(
+        headers={"Origin": "https://app.example", "Cookie": "session=1"}
+    )
+
+    assert headers[b"access-control-allow-origin"] == b"https://app.example"
+    assert headers[b"access-control-allow-credentials"] == b"true"
+    assert headers[b"vary"] == b"Origin"
+
+
+async def test_cookie_request_merges_existing_vary_header():
+    _, headers, _, _ = await _call(
+        headers={"Origin": "https://app.example", "Cookie": "session=1"},
+        app_headers=[(b"vary", b"Accept-Encoding")],
+    )
+
+    assert headers[b"vary"] == b"Accept-Encoding, Origin"
+
+
+async def test_preflight_is_answered_without_calling_the_app():
+    status, headers, body, app_called = await _call(
+        method="OPTIONS",
+        headers={
+            "Origin": "https://app.example",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert not app_called
+    assert status == 200
+    assert body == b"OK"
+    assert headers[b"access-control-allow-origin"] == b"https://app.example"
+    assert headers[b"access-control-allow-credentials"] == b"true"
+    assert b"POST" in headers[b"access-control-allow-methods"]
+    assert headers[b"access-control-allow-headers"] == b"content-type"
+    assert headers[b"access-control-max-age"] == b"600"
+
+
+async def test_options_without_request_method_reaches_the_app():
+    _, headers, _, app_called = await _call(
+        method="OPTIONS", headers={"Origin": "https://app.example"}
+    )
+
+    assert app_called
+    assert headers[b"access-control-allow-origin"] == b"*"
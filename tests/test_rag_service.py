@@ -0,0 +1,105 @@
+"""Tests for ResumeRAGService content-keyed collections and session release."""
+
+import hashlib
+
+import pytest
+
+RESUME_A = "Ada Lovelace\nAnalytical engines, Python services, FastAPI.\n" * 20
+RESUME_B = "Grace Hopper\nCompilers, COBOL, distributed systems.\n" * 20
+
+
+@pytest.fixture
+def extracted(rag_service, monkeypatch):
+    """Serve PDF text from memory and record which paths were parsed."""
+    texts = {"a.pdf": RESUME_A, "b.pdf": RESUME_B}
+    calls = []
+
+    def extract(pdf_path):
+        calls.append(pdf_path)
+        return texts[pdf_path]
+
+    monkeypatch.setattr(rag_service, "extract_text_from_pdf", extract)
+    return calls
+
+
+def _ingest(rag_service, pdf_path, session_id):
+    text = RESUME_A if pdf_path == "a.pdf" else RESUME_B
+    return rag_service.ingest_pdf_resume(
+        pdf_path, session_id, file_hash=hashlib.sha256(text.encode()).hexdigest()
+    )
+
+
+def _stored_chunks(rag_service, result):
+    name = rag_service._get_content_collection_name(result["file_hash"])
+    return rag_service._open_collection(name)._collection.count()
+
+
+def test_identical_resume_reuses_collection(rag_service, extracted):
+    first = _ingest(rag_service, "a.pdf", "session_1")
+    second = _ingest(rag_service, "a.pdf", "session_2")
+
+    assert not first["reused"]
+    assert second["reused"]
+    assert extracted == ["a.pdf"]
+    assert second["num_chunks"] == first["num_chunks"] > 0
+    # Read back from the stored chunks' metadata
+    assert second["text_length"] == first["text_length"] == len(RESUME_A)
+
+
+def test_different_resumes_get_separate_collections(rag_service, extracted):
+    _ingest(rag_service, "a.pdf", "session_1")
+    second = _ingest(rag_service, "b.pdf", "session_2")
+
+    assert not second["reused"]
+    assert extracted == ["a.pdf", "b.pdf"]
+
+
+def test_retrieval_is_scoped_to_the_session(rag_service, extracted):
+    _ingest(rag_service, "a.pdf", "session_a")
+    _ingest(rag_service, "b.pdf", "session_b")
+
+    contexts_a = rag_service.retrieve_contexts_batch(["experience"], k=3, session_id="session_a")
+    contexts_b = rag_service.retrieve_contexts_batch(["experience"], k=3, session_id="session_b")
+
+    assert all("Ada" in chunk for chunk in contexts_a[0])
+    assert all("Grace" in chunk for chunk in contexts_b[0])
+
+
+def test_release_session_keeps_collection_for_reuse(rag_service, extracted):
+    first = _ingest(rag_service, "a.pdf", "session_1")
+    rag_service.release_session("session_1")
+
+    assert "session_1" not in rag_service._session_collections
+    assert _stored_chunks(rag_service, first) == first["num_chunks"]
+    assert _ingest(rag_service, "a.pdf", "session_2")["reused"]
+    assert extracted == ["a.pdf"]
+
+
+def test_clear_session_keeps_collection_while_shared(rag_service, extracted):
+    first = _ingest(rag_service, "a.pdf", "session_1")
+    _ingest(rag_service, "a.pdf", "session_2")
+
+    rag_service.clear_session("session_1")
+
+    assert _stored_chunks(rag_service, first) == first["num_chunks"]
+    assert rag_service.retrieve_contexts_batch(["python"], k=1, session_id="session_2")[0]
+
+
+def test_clear_session_deletes_collection_after_last_session(rag_service, extracted):
+    first = _ingest(rag_service, "a.pdf", "session_1")
+    _ingest(rag_service, "a.pdf", "session_2")
+
+    rag_service.clear_session("session_1")
+    rag_service.clear_session("session_2")
+
+    assert _stored_chunks(rag_service, first) == 0
+
+
+def test_released_sessions_do_not_keep_collection_alive(rag_service, extracted):
+    first = _ingest(rag_service, "a.pdf", "session_1")
+    _ingest(rag_service, "a.pdf", "session_2")
+
+    rag_service.release_session("session_1")
+    rag_service.clear_session("session_2")
+
+    assert _stored_chunks(rag_service, first) == 0
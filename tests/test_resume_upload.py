@@ -0,0 +1,55 @@
+"""Tests for resume upload storage."""
+
+import hashlib
+import io
+
+import pytest
+
+from interview_coach.api import routes
+
+PDF_BYTES = b"%PDF-1.7\n" + b"resume body " * 100
+
+
+def test_store_resume_writes_content_addressed_file(upload_dir):
+    path, resume_sha, stored = routes._store_resume(io.BytesIO(PDF_BYTES), ".pdf")
+
+    assert stored
+    assert resume_sha == hashlib.sha256(PDF_BYTES).hexdigest()
+    assert path == upload_dir / f"{resume_sha}.pdf"
+    assert path.read_bytes() == PDF_BYTES
+
+
+def test_store_resume_reuses_existing_copy(upload_dir):
+    first_path, first_sha, _ = routes._store_resume(io.BytesIO(PDF_BYTES), ".pdf")
+    path, resume_sha, stored = routes._store_resume(io.BytesIO(PDF_BYTES), ".pdf")
+
+    assert not stored
+    assert (path, resume_sha) == (first_path, first_sha)
+    assert sorted(upload_dir.iterdir()) == [first_path]
+
+
+def test_store_resume_rejects_non_pdf_bytes(upload_dir):
+    with pytest.raises(ValueError, match="not a valid PDF"):
+        routes._store_resume(io.BytesIO(b"PK\x03\x04 not a pdf"), ".pdf")
+
+    # Rejected before the upload directory is even created
+    assert not upload_dir.exists()
+
+
+def test_store_resume_enforces_size_cap(monkeypatch, upload_dir):
+    monkeypatch.setattr(routes, "MAX_RESUME_BYTES", len(PDF_BYTES) - 1)
+
+    with pytest.raises(ValueError, match="upload limit"):
+        routes._store_resume(io.BytesIO(PDF_BYTES), ".pdf")
+
+    # The partial temp file is removed
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_store_resume_accepts_file_at_size_cap(monkeypatch, upload_dir):
+    monkeypatch.setattr(routes, "MAX_RESUME_BYTES", len(PDF_BYTES))
+    monkeypatch.setattr(routes, "UPLOAD_CHUNK_SIZE", 64)
+
+    _, _, stored = routes._store_resume(io.BytesIO(PDF_BYTES), ".pdf")
+
+    assert stored
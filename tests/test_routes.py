@@ -0,0 +1,162 @@
+"""Tests for the API routes: JSON parsing and the Server-Sent Event streams."""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+JOB_DESCRIPTION = (
+    "Senior Python Developer\n"
+    "Build FastAPI services and LLM pipelines for our interview platform."
+)
+TRANSCRIPT = [
+    {"question": "Tell me about a service you built.", "answer": "A FastAPI gateway."},
+    {"question": "How do you test async code?", "answer": "With pytest-asyncio."},
+]
+
+
+def _sse_events(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """Parse a text/event-stream body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+# ============================================================================
+# FastJSONRequest
+# ============================================================================
+
+async def test_malformed_json_is_a_422(client, fake_crew_run):
+    response = await client.post(
+        "/api/v1/evaluate",
+        content=b'{"job_description": "unterminated',
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+    assert not fake_crew_run.calls
+
+
+async def test_valid_json_is_parsed(client, fake_crew_run):
+    response = await client.post(
+        "/api/v1/evaluate",
+        content=json.dumps({
+            "job_description": JOB_DESCRIPTION,
+            "transcript": TRANSCRIPT,
+            "candidate_name": "Zoë",
+        }).encode(),
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["candidate_name"] == "Zoë"
+
+
+# ============================================================================
+# POST /sessions/stream
+# ============================================================================
+
+async def test_sessions_stream_sends_each_question_then_done(client, flow_script):
+    response = await client.post(
+        "/api/v1/sessions/stream",
+        data={"candidate_name": "Ada", "job_description": JOB_DESCRIPTION},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    assert events == [
+        *[("question", {"index": i, "question": q}) for i, q in enumerate(flow_script.questions)],
+        ("done", {"total_questions": len(flow_script.questions)}),
+    ]
+
+
+async def test_sessions_stream_reports_errors_after_start(client, flow_script):
+    flow_script.error = ValueError("crew exploded")
+
+    response = await client.post(
+        "/api/v1/sessions/stream",
+        data={"candidate_name": "Ada", "job_description": JOB_DESCRIPTION},
+    )
+
+    assert response.status_code == 200
+    events = _sse_events(response.text)
+    assert [name for name, _ in events] == ["question", "error"]
+    assert "crew exploded" in events[1][1]["detail"]
+
+
+async def test_sessions_stream_rejects_non_pdf_upload(client, flow_script, upload_dir):
+    response = await client.post(
+        "/api/v1/sessions/stream",
+        data={"candidate_name": "Ada", "job_description": JOB_DESCRIPTION},
+        files={"resume_pdf": ("resume.pdf", b"not a pdf", "application/pdf")},
+    )
+
+    assert response.status_code == 400
+    assert "not a valid PDF" in response.json()["detail"]
+    assert flow_script.runs == 0
+
+
+async def test_sessions_stream_with_resume_releases_session(
+    client, flow_script, fake_rag, upload_dir
+):
+    response = await client.post(
+        "/api/v1/sessions/stream",
+        data={"candidate_name": "Ada", "job_description": JOB_DESCRIPTION},
+        files={"resume_pdf": ("resume.pdf", b"%PDF-1.7 resume", "application/pdf")},
+    )
+
+    assert _sse_events(response.text)[-1][0] == "done"
+    flow = flow_script.flows[0]
+    assert flow.payload["resume_pdf_path"].startswith(str(upload_dir.resolve()))
+    assert fake_rag.released == [flow.state.session_id]
+
+
+# ============================================================================
+# POST /evaluate/stream
+# ============================================================================
+
+async def test_evaluate_stream_sends_started_sections_done(client, fake_crew_run):
+    fake_crew_run.report = "## Summary\nGood.\n## Strengths\nClear answers."
+
+    response = await client.post("/api/v1/evaluate/stream", json={
+        "job_description": JOB_DESCRIPTION,
+        "transcript": TRANSCRIPT,
+        "candidate_name": "Ada",
+    })
+
+    assert response.status_code == 200
+    events = _sse_events(response.text)
+    assert [name for name, _ in events] == ["started", "section", "section", "done"]
+    assert events[0][1] == {"candidate_name": "Ada", "questions_evaluated": 2}
+    assert events[1][1] == {"title": "Summary", "content": "Good."}
+    assert events[3][1]["questions_evaluated"] == 2
+
+
+async def test_evaluate_stream_reports_errors_after_start(client, evaluation_service, monkeypatch):
+    async def failing_run(job_description, transcript_text):
+        raise RuntimeError("provider unavailable")
+
+    monkeypatch.setattr(evaluation_service, "_run_crew", failing_run)
+
+    response = await client.post("/api/v1/evaluate/stream", json={
+        "job_description": JOB_DESCRIPTION,
+        "transcript": TRANSCRIPT,
+    })
+
+    assert response.status_code == 200
+    events = _sse_events(response.text)
+    assert [name for name, _ in events] == ["started", "error"]
+    assert "provider unavailable" in events[1][1]["detail"]
+
+
+async def test_evaluate_stream_rejects_invalid_request_before_streaming(client, fake_crew_run):
+    # Long enough for the request model, but blank once stripped
+    response = await client.post("/api/v1/evaluate/stream", json={
+        "job_description": " " * 60,
+        "transcript": TRANSCRIPT,
+    })
+
+    assert response.status_code == 400
+    assert not fake_crew_run.calls